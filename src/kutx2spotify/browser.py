@@ -3,25 +3,108 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 import random
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from types import TracebackType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import quote
 
+import orjson
 from playwright.async_api import async_playwright
 
 if TYPE_CHECKING:
-    from playwright.async_api import Browser, BrowserContext, Locator, Page
+    from playwright.async_api import Browser, BrowserContext, Locator, Page, Route
 
 # Duration tolerance in milliseconds (10 seconds)
 DURATION_TOLERANCE_MS = 10_000
 
+# Chromium flags that trim startup work and background activity
+LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-dev-shm-usage",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-sync",
+]
+
+# Extra flags when nobody is looking at the window: scraping is text-only
+HEADLESS_LAUNCH_ARGS = ["--blink-settings=imagesEnabled=false"]
+
+# Analytics hosts the scraper never needs; aborted before they hit the network
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "hotjar.com",
+    "sentry.io",
+)
+# Those hosts and their subdomains. Playwright matches the route pattern
+# itself, so no other request makes a round trip through Python.
+_BLOCKED_URL_PATTERN = re.compile(
+    r"^[a-z]+://(?:[^/?#]*\.)?(?:"
+    + "|".join(re.escape(host) for host in BLOCKED_HOSTS)
+    + r")(?::\d+)?(?:[/?#]|$)"
+)
+
+# Modifier key that adds a row to the current selection
+SELECT_MODIFIER: Literal["Control", "Meta"] = (
+    "Meta" if sys.platform == "darwin" else "Control"
+)
+
+# Selectors that tell a logged-in session from a logged-out one
+USER_WIDGET_SELECTOR = '[data-testid="user-widget-link"]'
+LOGIN_BUTTON_SELECTOR = '[data-testid="login-button"]'
+
+# How long to wait for either login selector before giving up
+LOGIN_CHECK_TIMEOUT_MS = 2500
+
+# Private RNG for human-like delays, so they never contend on the shared
+# module-level generator
+_rng = random.Random()
+
+# Extracts title, artist(s), album and duration text from the first `limit`
+# search result rows. Artist links are told apart from the album link by href.
+_EXTRACT_ROWS_JS = """
+(limit) => {
+    const text = (el) => (el ? el.innerText : "");
+    const rows = document.querySelectorAll('[data-testid="tracklist-row"]');
+    return Array.from(rows).slice(0, limit).map((row) => {
+        // Read each subtitle link's href and text exactly once
+        const links = Array.from(
+            row.querySelectorAll('span[data-testid="tracklist-row-subtitle"] a'),
+            (a) => ({ href: a.getAttribute("href") || "", text: a.innerText })
+        );
+        const album = links.find((link) => link.href.includes("/album/"));
+        return {
+            title: text(row.querySelector('[data-testid="internal-track-link"]')),
+            artist: links
+                .filter((link) => link.href.includes("/artist/"))
+                .map((link) => link.text)
+                .join(", "),
+            album: album ? album.text : "",
+            duration: text(
+                row.querySelector('[data-testid="tracklist-row-duration"]')
+            ),
+        };
+    });
+}
+"""
+
+
+def _album_eq(target_fold: str, candidate: str) -> bool:
+    """Compare an already casefolded album name against a raw one."""
+    return target_fold == candidate.casefold()
+
 
 def albums_match(album1: str, album2: str) -> bool:
-    """Check if albums match (case-insensitive).
+    """Check if albums match (case-insensitive, Unicode-aware).
 
     Args:
         album1: First album name.
@@ -30,7 +113,7 @@ def albums_match(album1: str, album2: str) -> bool:
     Returns:
         True if albums match.
     """
-    return album1.lower() == album2.lower()
+    return _album_eq(album1.casefold(), album2)
 
 
 @dataclass
@@ -59,6 +142,23 @@ class SelectionResult:
     alternatives: list[SearchResult]
 
 
+def is_blocked_request(url: str) -> bool:
+    """Check if a request goes to a blocked analytics host.
+
+    Args:
+        url: Request URL.
+
+    Returns:
+        True if the host is one of BLOCKED_HOSTS or a subdomain of one.
+    """
+    return _BLOCKED_URL_PATTERN.match(url) is not None
+
+
+async def _abort_request(route: Route) -> None:
+    """Abort a request routed here by the blocked-host pattern."""
+    await route.abort()
+
+
 def parse_duration(duration_str: str) -> int:
     """Parse duration string (M:SS) to milliseconds.
 
@@ -68,11 +168,11 @@ def parse_duration(duration_str: str) -> int:
     Returns:
         Duration in milliseconds.
     """
-    match = re.match(r"(\d+):(\d{2})", duration_str.strip())
-    if not match:
+    minutes, sep, rest = duration_str.strip().partition(":")
+    seconds = rest[:2]
+    if not (sep and minutes.isdecimal() and len(seconds) == 2 and seconds.isdecimal()):
         return 0
-    minutes, seconds = int(match.group(1)), int(match.group(2))
-    return (minutes * 60 + seconds) * 1000
+    return (int(minutes) * 60 + int(seconds)) * 1000
 
 
 def select_best_match(
@@ -100,31 +200,33 @@ def select_best_match(
     if not results:
         return SelectionResult(selected=None, reason="no_results", alternatives=[])
 
-    def duration_matches(result: SearchResult) -> bool:
-        return abs(result.duration_ms - target_duration_ms) <= DURATION_TOLERANCE_MS
-
-    # Priority 1: Album match + duration match
-    for result in results:
-        if albums_match(result.album, target_album) and duration_matches(result):
-            alternatives = [r for r in results if r is not result]
-            return SelectionResult(
-                selected=result, reason="exact_match", alternatives=alternatives
-            )
-
-    # Priority 2: Album match only
-    for result in results:
-        if albums_match(result.album, target_album):
-            alternatives = [r for r in results if r is not result]
-            return SelectionResult(
-                selected=result, reason="album_match", alternatives=alternatives
-            )
-
-    # Priority 3: Duration match only
+    # Single pass recording the first result in each priority category
+    target_fold = target_album.casefold()
+    exact_hit: SearchResult | None = None
+    album_hit: SearchResult | None = None
+    duration_hit: SearchResult | None = None
     for result in results:
-        if duration_matches(result):
-            alternatives = [r for r in results if r is not result]
+        album_ok = _album_eq(target_fold, result.album)
+        diff = abs(result.duration_ms - target_duration_ms)
+        duration_ok = diff <= DURATION_TOLERANCE_MS
+        if album_ok and duration_ok:
+            exact_hit = result
+            break
+        if album_ok and album_hit is None:
+            album_hit = result
+        elif duration_ok and duration_hit is None:
+            duration_hit = result
+
+    # Priorities 1-3: first hit in the highest-priority category
+    for selected, reason in (
+        (exact_hit, "exact_match"),
+        (album_hit, "album_match"),
+        (duration_hit, "duration_match"),
+    ):
+        if selected is not None:
+            alternatives = [r for r in results if r is not selected]
             return SelectionResult(
-                selected=result, reason="duration_match", alternatives=alternatives
+                selected=selected, reason=reason, alternatives=alternatives
             )
 
     # Priority 4: First result
@@ -134,31 +236,51 @@ def select_best_match(
     )
 
 
+@functools.lru_cache(maxsize=1)
 def get_cookie_path() -> Path:
-    """Get path to cookie storage file."""
+    """Get path to cookie storage file.
+
+    The cache directory is created on the first call only.
+    """
     cache_dir = Path.home() / ".cache" / "kutx2spotify"
     cache_dir.mkdir(parents=True, exist_ok=True)
     return cache_dir / "spotify_cookies.json"
 
 
+@functools.lru_cache(maxsize=1)
+def _read_cookie_file(
+    path: Path,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+) -> list[dict[str, object]] | None:
+    """Parse a cookie file, memoized on its modification time and size."""
+    try:
+        data = orjson.loads(path.read_bytes())
+        if isinstance(data, list):
+            return data
+        return None
+    except (orjson.JSONDecodeError, OSError):
+        return None
+
+
 def save_cookies(cookies: list[dict[str, object]]) -> None:
     """Save cookies to disk."""
     path = get_cookie_path()
-    path.write_text(json.dumps(cookies, indent=2))
+    path.write_bytes(orjson.dumps(cookies))
+    _read_cookie_file.cache_clear()
 
 
 def load_cookies() -> list[dict[str, object]] | None:
-    """Load cookies from disk, return None if not found."""
+    """Load cookies from disk, return None if not found.
+
+    The file is only re-read when it has changed since the last load.
+    """
     path = get_cookie_path()
-    if not path.exists():
-        return None
     try:
-        data = json.loads(path.read_text())
-        if isinstance(data, list):
-            return data
-        return None
-    except (json.JSONDecodeError, OSError):
+        st = path.stat()
+    except OSError:
         return None
+    return _read_cookie_file(path, st.st_mtime_ns, st.st_size)
 
 
 def clear_cookies() -> None:
@@ -166,6 +288,7 @@ def clear_cookies() -> None:
     path = get_cookie_path()
     if path.exists():
         path.unlink()
+    _read_cookie_file.cache_clear()
 
 
 async def human_delay(min_ms: int = 1000, max_ms: int = 2000) -> None:
@@ -175,34 +298,60 @@ async def human_delay(min_ms: int = 1000, max_ms: int = 2000) -> None:
         min_ms: Minimum delay in milliseconds.
         max_ms: Maximum delay in milliseconds.
     """
-    delay = random.randint(min_ms, max_ms) / 1000
-    await asyncio.sleep(delay)
+    await asyncio.sleep(_rng.uniform(min_ms, max_ms) / 1000)
 
 
 class SpotifyBrowser:
     """Playwright-based Spotify web automation."""
 
     SPOTIFY_URL = "https://open.spotify.com"
+    _LOGIN_URL = SPOTIFY_URL + "/login"
+    _PLAYLISTS_URL = SPOTIFY_URL + "/collection/playlists"
+    _SEARCH_FMT = SPOTIFY_URL + "/search/{}/tracks"
 
-    def __init__(self, headless: bool = False) -> None:
+    def __init__(self, headless: bool = False, stealth_mode: bool = False) -> None:
         """Initialize SpotifyBrowser.
 
         Args:
             headless: Run browser in headless mode. Defaults to False for
                 manual login flow.
+            stealth_mode: Insert random human-like delays between actions.
+                Defaults to False; Playwright's auto-waiting handles page
+                readiness on its own. Ignored when headless.
         """
         self.headless = headless
+        self.stealth_mode = stealth_mode
+        self._delays_enabled = stealth_mode and not headless
         self._playwright: Any = None
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
         self._page: Page | None = None
+        self._search_page: Page | None = None
+        self._search_turn = 0
+        self._restored_session = False
 
     async def __aenter__(self) -> SpotifyBrowser:
-        """Start browser session."""
+        """Start browser session, restoring saved cookies if available."""
         self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(headless=self.headless)
-        self._context = await self._browser.new_context()
+        args = LAUNCH_ARGS + HEADLESS_LAUNCH_ARGS if self.headless else LAUNCH_ARGS
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.headless, args=args
+        )
+        cookies = await asyncio.to_thread(load_cookies)
+        if cookies:
+            # Seed the context at creation instead of a separate add_cookies call
+            self._context = await self._browser.new_context(
+                storage_state={"cookies": cookies, "origins": []}  # type: ignore[arg-type]
+            )
+            self._restored_session = True
+        else:
+            self._context = await self._browser.new_context()
+        if self.headless:
+            # Routing costs Chromium its HTTP cache, and a headed window may
+            # need every request (a login captcha's images, for one)
+            await self._context.route(_BLOCKED_URL_PATTERN, _abort_request)
         self._page = await self._context.new_page()
+        self._search_page = await self._context.new_page()
         return self
 
     async def __aexit__(
@@ -226,17 +375,29 @@ class SpotifyBrowser:
             raise RuntimeError("Browser not started. Use 'async with SpotifyBrowser()'")
         return self._page
 
-    async def _load_cookies(self) -> bool:
-        """Load cookies from disk into browser context.
+    def _next_search_page(self) -> Page:
+        """Alternate searches between the main page and a second page.
 
-        Returns:
-            True if cookies were loaded, False otherwise.
+        Search result rows are only valid on the page that produced them, so
+        one page's results can still be added to a playlist while the next
+        search loads on the other.
         """
-        cookies = load_cookies()
-        if cookies and self._context:
-            await self._context.add_cookies(cookies)  # type: ignore[arg-type]
-            return True
-        return False
+        page = self.page
+        if self._search_page is not None and self._search_turn % 2:
+            page = self._search_page
+        self._search_turn += 1
+        return page
+
+    async def _delay(self, min_ms: int = 1000, max_ms: int = 2000) -> None:
+        """Random human-like delay, only applied in headed stealth mode.
+
+        Args:
+            min_ms: Minimum delay in milliseconds.
+            max_ms: Maximum delay in milliseconds.
+        """
+        if not self._delays_enabled:
+            return
+        await human_delay(min_ms, max_ms)
 
     async def _save_cookies(self) -> None:
         """Save cookies from browser context to disk."""
@@ -247,18 +408,41 @@ class SpotifyBrowser:
     async def _is_logged_in(self) -> bool:
         """Check if user is logged in to Spotify.
 
+        Waits for either the user widget (logged in) or the login button
+        (logged out), whichever appears first.
+
         Returns:
             True if logged in, False otherwise.
         """
-        await self.page.goto(self.SPOTIFY_URL)
-        await human_delay()
-        try:
-            await self.page.wait_for_selector(
-                '[data-testid="user-widget-link"]', timeout=5000
+        await self.page.goto(self.SPOTIFY_URL, wait_until="domcontentloaded")
+        await self._delay()
+
+        logged_in = asyncio.create_task(
+            self.page.wait_for_selector(
+                USER_WIDGET_SELECTOR, state="attached", timeout=LOGIN_CHECK_TIMEOUT_MS
             )
-            return True
-        except Exception:
+        )
+        logged_out = asyncio.create_task(
+            self.page.wait_for_selector(
+                LOGIN_BUTTON_SELECTOR, state="attached", timeout=LOGIN_CHECK_TIMEOUT_MS
+            )
+        )
+        pending: set[asyncio.Task[Any]] = {logged_in, logged_out}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # A selector that timed out settles nothing; keep waiting
+                if logged_in in done and logged_in.exception() is None:
+                    return True
+                if logged_out in done and logged_out.exception() is None:
+                    return False
             return False
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
     async def _wait_for_manual_login(self, timeout_seconds: int = 120) -> bool:
         """Wait for user to manually log in.
@@ -270,10 +454,10 @@ class SpotifyBrowser:
             True if login successful, False if timed out.
         """
         print("Please log in to Spotify in the browser window...")
-        await self.page.goto(f"{self.SPOTIFY_URL}/login")
+        await self.page.goto(self._LOGIN_URL, wait_until="domcontentloaded")
         try:
             await self.page.wait_for_selector(
-                '[data-testid="user-widget-link"]', timeout=timeout_seconds * 1000
+                USER_WIDGET_SELECTOR, timeout=timeout_seconds * 1000
             )
             await self._save_cookies()
             print("Login successful! Cookies saved.")
@@ -291,11 +475,14 @@ class SpotifyBrowser:
         Returns:
             True if logged in, False if login failed/timed out.
         """
-        if not force_login:
-            await self._load_cookies()
-            if await self._is_logged_in():
-                print("Logged in using saved session.")
-                return True
+        # Without saved cookies a fresh context can't be logged in, so skip
+        # the navigation and selector wait and go straight to manual login
+        if force_login:
+            if self._restored_session and self._context:
+                await self._context.clear_cookies()
+        elif self._restored_session and await self._is_logged_in():
+            print("Logged in using saved session.")
+            return True
         return await self._wait_for_manual_login()
 
     async def create_playlist(self, name: str) -> str | None:
@@ -307,9 +494,9 @@ class SpotifyBrowser:
         Returns:
             URL of the created playlist, or None if creation failed.
         """
-        await human_delay()
-        await self.page.goto(f"{self.SPOTIFY_URL}")
-        await human_delay()
+        await self._delay()
+        await self.page.goto(self.SPOTIFY_URL, wait_until="domcontentloaded")
+        await self._delay()
 
         # Try multiple approaches to create a playlist
         # Approach 1: Click the + button in the sidebar (Your Library section)
@@ -319,36 +506,37 @@ class SpotifyBrowser:
                 'button[aria-label="Create playlist or folder"]'
             ).first
             await create_btn.click(timeout=5000)
-            await human_delay()
+            await self._delay()
 
             # Click "Create a new playlist" in the menu
             new_playlist_option = self.page.locator(
                 'button:has-text("Create a new playlist")'
             ).first
             await new_playlist_option.click(timeout=5000)
-            await human_delay()
+            await self._delay()
         except Exception:
             # Approach 2: Try right-clicking in library area
             try:
-                library_section = self.page.locator(
-                    '[data-testid="rootlist-item"]'
-                ).first
+                library_section = self.page.get_by_test_id("rootlist-item").first
                 await library_section.click(button="right", timeout=5000)
-                await human_delay()
+                await self._delay()
 
                 create_option = self.page.locator(
                     'button:has-text("Create playlist")'
                 ).first
                 await create_option.click(timeout=5000)
-                await human_delay()
+                await self._delay()
             except Exception:
                 # Approach 3: Navigate directly and try old selector
-                await self.page.goto(f"{self.SPOTIFY_URL}/collection/playlists")
-                await human_delay()
+                await self.page.goto(
+                    self._PLAYLISTS_URL,
+                    wait_until="domcontentloaded",
+                )
+                await self._delay()
 
-                create_btn = self.page.locator('[data-testid="create-playlist-button"]')
+                create_btn = self.page.get_by_test_id("create-playlist-button")
                 await create_btn.click(timeout=10000)
-                await human_delay()
+                await self._delay()
 
         # Wait for playlist page to load
         try:
@@ -367,7 +555,7 @@ class SpotifyBrowser:
                 'h1[data-encore-id="text"]'
             ).first
             await title_element.click(timeout=5000)
-            await human_delay()
+            await self._delay()
 
             # Find and fill the name input
             name_input = self.page.locator(
@@ -375,8 +563,9 @@ class SpotifyBrowser:
                 'input[placeholder*="playlist"], '
                 'input[type="text"]'
             ).first
+            await name_input.wait_for(state="visible", timeout=5000)
             await name_input.fill(name, timeout=5000)
-            await human_delay()
+            await self._delay()
 
             # Save changes
             save_btn = self.page.locator(
@@ -384,7 +573,7 @@ class SpotifyBrowser:
                 'button:has-text("Save")'
             ).first
             await save_btn.click(timeout=5000)
-            await human_delay()
+            await self._delay()
         except Exception:
             # If renaming fails, playlist is still created with default name
             pass
@@ -394,6 +583,9 @@ class SpotifyBrowser:
     async def search_tracks(self, query: str, limit: int = 5) -> list[SearchResult]:
         """Search for tracks on Spotify web.
 
+        Consecutive searches alternate between two pages, so the results of
+        one search stay clickable while the next one runs.
+
         Args:
             query: Search query string (e.g., "artist title").
             limit: Maximum number of results to return.
@@ -401,68 +593,37 @@ class SpotifyBrowser:
         Returns:
             List of SearchResult objects with parsed track information.
         """
-        await human_delay()
-        # URL encode the query for search
-        encoded_query = query.replace(" ", "%20")
-        search_url = f"{self.SPOTIFY_URL}/search/{encoded_query}/tracks"
-        await self.page.goto(search_url)
-        await human_delay()
+        await self._delay()
+        # Encode everything, including "/", "?", "#" and "&" in titles
+        search_url = self._SEARCH_FMT.format(quote(query, safe=""))
+        page = self._next_search_page()
+        await page.goto(search_url, wait_until="domcontentloaded")
+        await self._delay()
 
         try:
-            await self.page.wait_for_selector(
-                '[data-testid="tracklist-row"]', timeout=10000
-            )
+            await page.wait_for_selector('[data-testid="tracklist-row"]', timeout=10000)
         except Exception:
             # No results found
             return []
 
-        rows = self.page.locator('[data-testid="tracklist-row"]')
-        count = min(await rows.count(), limit)
-
-        results: list[SearchResult] = []
-        for i in range(count):
-            row = rows.nth(i)
-
-            # Parse title from the track-title link
-            title_elem = row.locator('[data-testid="internal-track-link"]').first
-            title = await title_elem.inner_text()
-
-            # Parse artist(s) - multiple links in the span
-            artist_links = row.locator('span[data-testid="tracklist-row-subtitle"] a')
-            artist_count = await artist_links.count()
-            artists: list[str] = []
-            for j in range(artist_count):
-                artist_text = await artist_links.nth(j).inner_text()
-                # Skip album links (those containing album in href)
-                href = await artist_links.nth(j).get_attribute("href") or ""
-                if "/artist/" in href:
-                    artists.append(artist_text)
-            artist = ", ".join(artists) if artists else ""
-
-            # Parse album - typically the last link in subtitle
-            album_links = row.locator(
-                'span[data-testid="tracklist-row-subtitle"] a[href*="/album/"]'
+        # Extract every row's fields in a single round-trip to the page
+        row_data: list[dict[str, str]] = await page.evaluate(_EXTRACT_ROWS_JS, limit)
+        # nth() locators resolve lazily on click, so building them costs no
+        # extra round-trip (unlike count() or all())
+        rows = page.get_by_test_id("tracklist-row")
+
+        return [
+            SearchResult(
+                title=data["title"],
+                artist=data["artist"],
+                # Albums repeat across searches; interning makes equal
+                # names share one object
+                album=sys.intern(data["album"]),
+                duration_ms=parse_duration(data["duration"]),
+                row_locator=rows.nth(i),
             )
-            album = ""
-            if await album_links.count() > 0:
-                album = await album_links.first.inner_text()
-
-            # Parse duration from the duration column
-            duration_elem = row.locator('[data-testid="tracklist-row-duration"]').first
-            duration_text = await duration_elem.inner_text()
-            duration_ms = parse_duration(duration_text)
-
-            results.append(
-                SearchResult(
-                    title=title,
-                    artist=artist,
-                    album=album,
-                    duration_ms=duration_ms,
-                    row_locator=row,
-                )
-            )
-
-        return results
+            for i, data in enumerate(row_data)
+        ]
 
     async def add_to_current_playlist(
         self, result: SearchResult, playlist_name: str
@@ -476,22 +637,50 @@ class SpotifyBrowser:
         Returns:
             True if track was added successfully.
         """
-        await human_delay()
+        return await self.add_many_to_current_playlist([result], playlist_name)
 
-        # Right-click on the row to open context menu
-        await result.row_locator.click(button="right")
-        await human_delay(500, 1000)
+    async def add_many_to_current_playlist(
+        self, results: list[SearchResult], playlist_name: str
+    ) -> bool:
+        """Add several tracks to the current playlist in one context-menu flow.
+
+        Rows are multi-selected with Ctrl/Cmd-click, so all results must come
+        from the same search_tracks call.
+
+        Args:
+            results: SearchResults from a single search.
+            playlist_name: Name of the playlist to add to.
+
+        Returns:
+            True if the tracks were added, False if there was nothing to add.
+        """
+        if not results:
+            return False
+
+        await self._delay()
+
+        # Build the selection; right-clicking a single row selects it anyway
+        if len(results) > 1:
+            await results[0].row_locator.click()
+            for result in results[1:]:
+                await result.row_locator.click(modifiers=[SELECT_MODIFIER])
+            await self._delay(500, 1000)
+
+        # The context menu opens on the page the rows belong to
+        page = results[-1].row_locator.page
+
+        # Right-click on the (last) row to open context menu
+        await results[-1].row_locator.click(button="right")
+        await self._delay(500, 1000)
 
         # Click "Add to playlist" menu item
-        add_to_playlist = self.page.locator(
-            'button[data-testid="add-to-playlist-button"]'
-        )
+        add_to_playlist = page.get_by_test_id("add-to-playlist-button")
         await add_to_playlist.click()
-        await human_delay(500, 1000)
+        await self._delay(500, 1000)
 
         # Select the target playlist from the submenu
-        playlist_option = self.page.locator(f'button:has-text("{playlist_name}")')
+        playlist_option = page.locator(f'button:has-text("{playlist_name}")')
         await playlist_option.click()
-        await human_delay()
+        await self._delay()
 
         return True
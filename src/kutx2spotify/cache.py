@@ -1,17 +1,27 @@
 """Caching layer for KUTX playlist data and match resolutions."""
 
-import json
+import functools
+import os
+import sqlite3
+import tempfile
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
-from kutx2spotify.models import Song
+import orjson
+
+from kutx2spotify.models import Song, make_lookup_key
 
 DEFAULT_CACHE_DIR = Path.home() / ".cache" / "kutx2spotify"
 DEFAULT_KUTX_TTL_HOURS = 24
 
+# Version tag for playlist cache files that store songs as positional rows
+SONG_ROWS_VERSION = 2
+
 
 def _get_cache_dir() -> Path:
     """Get the cache directory, creating it if needed."""
@@ -20,28 +30,105 @@ def _get_cache_dir() -> Path:
     return cache_dir
 
 
-def _song_to_dict(song: Song) -> dict[str, Any]:
-    """Convert a Song to a JSON-serializable dict."""
-    return {
-        "title": song.title,
-        "artist": song.artist,
-        "album": song.album,
-        "duration_ms": song.duration_ms,
-        "played_at": song.played_at.isoformat(),
-    }
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a file so readers never see a partially written version.
+
+    Args:
+        path: Destination file.
+        data: Bytes to write.
+    """
+    # A unique name, so concurrent writers never share a temp file
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _encode_played_at(played_at: datetime) -> int:
+    """Encode a naive wall-clock play time as whole seconds since the epoch.
+
+    The value is computed as if the time were UTC, so it round-trips
+    exactly regardless of the machine's time zone or DST transitions.
+    """
+    return int(played_at.replace(tzinfo=UTC).timestamp())
+
+
+def _decode_played_at(value: int | str) -> datetime:
+    """Decode a play time written by _encode_played_at.
+
+    ISO strings from older cache files are still accepted.
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return datetime.fromtimestamp(value, UTC).replace(tzinfo=None)
+
+
+def _song_to_row(song: Song) -> list[Any]:
+    """Convert a Song to a JSON-serializable positional row."""
+    return [
+        song.title,
+        song.artist,
+        song.album,
+        song.duration_ms,
+        _encode_played_at(song.played_at),
+    ]
+
+
+def _row_to_song(row: list[Any]) -> Song:
+    """Convert a positional row back to a Song."""
+    title, artist, album, duration_ms, played_at = row
+    # Positional call: rows are decoded in bulk and skip keyword matching
+    return Song(title, artist, album, duration_ms, _decode_played_at(played_at))
 
 
 def _dict_to_song(data: dict[str, Any]) -> Song:
-    """Convert a dict back to a Song."""
+    """Convert a legacy dict-per-song entry back to a Song."""
     return Song(
         title=data["title"],
         artist=data["artist"],
         album=data["album"],
         duration_ms=data["duration_ms"],
-        played_at=datetime.fromisoformat(data["played_at"]),
+        played_at=_decode_played_at(data["played_at"]),
     )
 
 
+@functools.lru_cache(maxsize=32)
+def _read_songs(
+    path: Path,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+) -> tuple[Song, ...] | None:
+    """Parse a playlist cache file, memoized on its modification time and size.
+
+    Songs are returned in play order so time ranges can be bisected. Files
+    written before positional rows were introduced hold a list of
+    dicts; they are still read so an upgrade does not force a refetch.
+    """
+    try:
+        data = orjson.loads(path.read_bytes())
+        if isinstance(data, list):
+            songs = list(map(_dict_to_song, data))
+        elif data.get("v") == SONG_ROWS_VERSION:
+            songs = list(map(_row_to_song, data["songs"]))
+        else:
+            return None
+        songs.sort(key=attrgetter("played_at"))
+        return tuple(songs)
+    except (
+        FileNotFoundError,
+        orjson.JSONDecodeError,
+        AttributeError,
+        KeyError,
+        TypeError,
+        ValueError,
+    ):
+        return None
+
+
 class KUTXCache:
     """Cache for KUTX playlist data.
 
@@ -68,16 +155,40 @@ class KUTXCache:
 
     def _cache_path(self, date: datetime) -> Path:
         """Get the cache file path for a date."""
-        return self.cache_dir / f"{date.strftime('%Y-%m-%d')}.json"
+        return self.cache_dir / f"{date.date().isoformat()}.json"
 
-    def _is_expired(self, path: Path) -> bool:
-        """Check if a cache file has expired based on TTL."""
-        if not path.exists():
-            return True
-        mtime = path.stat().st_mtime
-        age_hours = (time.time() - mtime) / 3600
+    def _is_expired(self, st: os.stat_result, now: float | None = None) -> bool:
+        """Check if a cache file has expired based on TTL.
+
+        Args:
+            st: Result of stat() on the cache file.
+            now: Current time, when checking many files at once.
+
+        Returns:
+            True if the file is older than the TTL.
+        """
+        if now is None:
+            now = time.time()
+        age_hours = (now - st.st_mtime) / 3600
         return age_hours > self.ttl_hours
 
+    def _scan_expiry(self) -> Iterator[tuple[str, bool]]:
+        """Check every cache file against the TTL in one directory pass.
+
+        Yields:
+            (path, expired) for each cache file.
+        """
+        now = time.time()
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        # Removed by another process since the listing
+                        continue
+                    yield entry.path, self._is_expired(st, now)
+
     def get(self, date: datetime) -> list[Song] | None:
         """Get cached playlist for a date.
 
@@ -89,18 +200,16 @@ class KUTXCache:
         """
         path = self._cache_path(date)
 
-        if not path.exists():
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             return None
 
-        if self._is_expired(path):
+        if self._is_expired(st):
             return None
 
-        try:
-            with path.open("r") as f:
-                data = json.load(f)
-            return [_dict_to_song(d) for d in data]
-        except (json.JSONDecodeError, KeyError):
-            return None
+        songs = _read_songs(path, st.st_mtime_ns, st.st_size)
+        return list(songs) if songs is not None else None
 
     def set(self, date: datetime, songs: list[Song]) -> None:
         """Cache playlist data for a date.
@@ -110,9 +219,8 @@ class KUTXCache:
             songs: List of songs to cache.
         """
         path = self._cache_path(date)
-        data = [_song_to_dict(s) for s in songs]
-        with path.open("w") as f:
-            json.dump(data, f)
+        data = {"v": SONG_ROWS_VERSION, "songs": [_song_to_row(s) for s in songs]}
+        _atomic_write_bytes(path, orjson.dumps(data))
 
     def clear(self, date: datetime) -> bool:
         """Clear cached data for a specific date.
@@ -123,11 +231,11 @@ class KUTXCache:
         Returns:
             True if cache was cleared, False if no cache existed.
         """
-        path = self._cache_path(date)
-        if path.exists():
-            path.unlink()
-            return True
-        return False
+        try:
+            self._cache_path(date).unlink()
+        except FileNotFoundError:
+            return False
+        return True
 
     def clear_all(self) -> int:
         """Clear all cached KUTX data.
@@ -136,13 +244,35 @@ class KUTXCache:
             Number of cache files deleted.
         """
         count = 0
-        for path in self.cache_dir.glob("*.json"):
-            path.unlink()
-            count += 1
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        continue
+                    count += 1
         return count
 
+    def clear_expired(self) -> int:
+        """Clear cached KUTX data that has outlived the TTL.
 
-@dataclass(frozen=True)
+        Returns:
+            Number of cache files deleted.
+        """
+        count = 0
+        for path, expired in self._scan_expiry():
+            if expired:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    # Another run cleared it first
+                    continue
+                count += 1
+        return count
+
+
+@dataclass(frozen=True, slots=True)
 class Resolution:
     """A stored resolution for a song match."""
 
@@ -151,58 +281,179 @@ class Resolution:
     note: str = ""
 
 
+# Bumped whenever the resolutions table or its key format changes
+RESOLUTION_SCHEMA_VERSION = 3
+
+# Songs Spotify could not match are searched again after this many days
+DEFAULT_MISS_TTL_DAYS = 7
+
+_UPSERT_RESOLUTION_SQL = (
+    "INSERT INTO resolutions (key, spotify_uri, resolved_album, note) "
+    "VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(key) DO UPDATE SET "
+    "spotify_uri = excluded.spotify_uri, "
+    "resolved_album = excluded.resolved_album, "
+    "note = excluded.note"
+)
+
+
 def _make_resolution_key(song: Song) -> str:
-    """Create a case-insensitive key for a song.
+    """Get the case-insensitive key for a song.
 
-    Key format: title|artist|album (all lowercase)
+    Key format: title|artist|album (casefolded, whitespace collapsed),
+    precomputed on the Song.
     """
-    return f"{song.title}|{song.artist}|{song.album}".lower()
+    return song.lookup_key
+
+
+def _rekey_resolutions(conn: sqlite3.Connection) -> None:
+    """Rewrite stored keys that predate the current key format.
+
+    Args:
+        conn: Open connection to the resolutions database.
+    """
+    rows = conn.execute(
+        "SELECT key, spotify_uri, resolved_album, note FROM resolutions"
+    ).fetchall()
+    for key, spotify_uri, resolved_album, note in rows:
+        parts = key.split("|", 2)
+        if len(parts) != 3:
+            continue
+        new_key = make_lookup_key(*parts)
+        if new_key != key:
+            conn.execute("DELETE FROM resolutions WHERE key = ?", (key,))
+            conn.execute(
+                _UPSERT_RESOLUTION_SQL, (new_key, spotify_uri, resolved_album, note)
+            )
 
 
 class ResolutionCache:
     """Cache for match resolutions.
 
-    Stores user decisions about song-to-track matches.
-    Default location: ~/.cache/kutx2spotify/resolutions.json
+    Stores user decisions about song-to-track matches in a SQLite table
+    keyed by song. Default location: ~/.cache/kutx2spotify/resolutions.db
+
+    Songs that Spotify searches found nothing for are remembered in a
+    second table, so later runs skip them until the miss expires.
+
+    Changes are committed by flush(), or when the cache is used as a
+    context manager and the block exits. Resolutions from an earlier
+    resolutions.json next to the database are imported when the database
+    is first created.
     """
 
-    def __init__(self, cache_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        cache_path: Path | None = None,
+        miss_ttl_days: int = DEFAULT_MISS_TTL_DAYS,
+    ) -> None:
         """Initialize the resolution cache.
 
+        The database is opened on first use.
+
         Args:
-            cache_path: Path to the cache file.
-                       Defaults to ~/.cache/kutx2spotify/resolutions.json
+            cache_path: Path to the database file.
+                       Defaults to ~/.cache/kutx2spotify/resolutions.db
+            miss_ttl_days: Days a recorded miss is trusted. Defaults to 7.
         """
         if cache_path is None:
-            cache_path = _get_cache_dir() / "resolutions.json"
+            cache_path = _get_cache_dir() / "resolutions.db"
         self.cache_path = cache_path
-        self._data: dict[str, dict[str, Any]] | None = None
-
-    def _load(self) -> dict[str, dict[str, Any]]:
-        """Load the resolution cache from disk."""
-        if self._data is not None:
-            return self._data
-
-        if not self.cache_path.exists():
-            self._data = {}
-            return self._data
-
+        self.miss_ttl_days = miss_ttl_days
+        self._conn: sqlite3.Connection | None = None
+        # Resolutions already read or written this session, by key
+        self._resolved: dict[str, Resolution] = {}
+        # Keys already looked up and found to have no resolution
+        self._unresolved: set[str] = set()
+
+    def __enter__(self) -> "ResolutionCache":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit context manager, committing pending changes and closing."""
+        self.close()
+
+    def _db(self) -> sqlite3.Connection:
+        """Get the database connection, opening it if needed."""
+        if self._conn is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                self._conn = self._open()
+            except sqlite3.OperationalError:
+                # Locked or unreadable: the data may be fine, so keep it
+                raise
+            except sqlite3.DatabaseError:
+                # Not a database (or damaged beyond use): start over
+                for suffix in ("", "-wal", "-shm"):
+                    Path(f"{self.cache_path}{suffix}").unlink(missing_ok=True)
+                self._conn = self._open()
+        return self._conn
+
+    def _open(self) -> sqlite3.Connection:
+        """Open the database and create the schema if it is new."""
+        conn = sqlite3.connect(self.cache_path)
         try:
-            with self.cache_path.open("r") as f:
-                self._data = json.load(f)
-        except json.JSONDecodeError:
-            self._data = {}
-
-        return self._data
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version < RESOLUTION_SCHEMA_VERSION:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS resolutions ("
+                    "key TEXT PRIMARY KEY, "
+                    "spotify_uri TEXT NOT NULL, "
+                    "resolved_album TEXT NOT NULL, "
+                    "note TEXT NOT NULL DEFAULT '')"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS misses ("
+                    "key TEXT PRIMARY KEY, "
+                    "checked_at INTEGER NOT NULL)"
+                )
+                if version == 0:
+                    conn.executemany(_UPSERT_RESOLUTION_SQL, self._read_legacy_json())
+                _rekey_resolutions(conn)
+                conn.execute(f"PRAGMA user_version = {RESOLUTION_SCHEMA_VERSION}")
+                conn.commit()
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
+
+    def _read_legacy_json(self) -> list[tuple[str, str, str, str]]:
+        """Read rows from a resolutions.json written by earlier versions."""
+        legacy_path = self.cache_path.with_suffix(".json")
+        if legacy_path == self.cache_path:
+            return []
 
-    def _save(self) -> None:
-        """Save the resolution cache to disk."""
-        if self._data is None:
+        try:
+            data = orjson.loads(legacy_path.read_bytes())
+            return [
+                (key, e["spotify_uri"], e["resolved_album"], e.get("note", ""))
+                for key, e in data.items()
+            ]
+        except (
+            FileNotFoundError,
+            orjson.JSONDecodeError,
+            AttributeError,
+            KeyError,
+            TypeError,
+        ):
+            return []
+
+    def flush(self) -> None:
+        """Commit pending changes, if there are any."""
+        if self._conn is not None and self._conn.in_transaction:
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Commit pending changes and close the database."""
+        if self._conn is None:
             return
 
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.cache_path.open("w") as f:
-            json.dump(self._data, f, indent=2)
+        self.flush()
+        self._conn.close()
+        self._conn = None
 
     def has(self, song: Song) -> bool:
         """Check if a resolution exists for a song.
@@ -214,7 +465,17 @@ class ResolutionCache:
             True if a resolution exists.
         """
         key = _make_resolution_key(song)
-        return key in self._load()
+        if key in self._resolved:
+            return True
+        if key in self._unresolved:
+            return False
+
+        row = (
+            self._db()
+            .execute("SELECT 1 FROM resolutions WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return row is not None
 
     def get(self, song: Song) -> Resolution | None:
         """Get a stored resolution for a song.
@@ -226,17 +487,30 @@ class ResolutionCache:
             Resolution if found, None otherwise.
         """
         key = _make_resolution_key(song)
-        data = self._load()
-
-        if key not in data:
+        resolution = self._resolved.get(key)
+        if resolution is not None or key in self._unresolved:
+            return resolution
+
+        row = (
+            self._db()
+            .execute(
+                "SELECT spotify_uri, resolved_album, note FROM resolutions WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            self._unresolved.add(key)
             return None
 
-        entry = data[key]
-        return Resolution(
-            spotify_uri=entry["spotify_uri"],
-            resolved_album=entry["resolved_album"],
-            note=entry.get("note", ""),
+        spotify_uri, resolved_album, note = row
+        resolution = Resolution(
+            spotify_uri=spotify_uri,
+            resolved_album=resolved_album,
+            note=note,
         )
+        self._resolved[key] = resolution
+        return resolution
 
     def set(self, song: Song, resolution: Resolution) -> None:
         """Store a resolution for a song.
@@ -246,13 +520,12 @@ class ResolutionCache:
             resolution: The resolution to store.
         """
         key = _make_resolution_key(song)
-        data = self._load()
-        data[key] = {
-            "spotify_uri": resolution.spotify_uri,
-            "resolved_album": resolution.resolved_album,
-            "note": resolution.note,
-        }
-        self._save()
+        self._db().execute(
+            _UPSERT_RESOLUTION_SQL,
+            (key, resolution.spotify_uri, resolution.resolved_album, resolution.note),
+        )
+        self._resolved[key] = resolution
+        self._unresolved.discard(key)
 
     def remove(self, song: Song) -> bool:
         """Remove a resolution for a song.
@@ -264,14 +537,10 @@ class ResolutionCache:
             True if resolution was removed, False if not found.
         """
         key = _make_resolution_key(song)
-        data = self._load()
-
-        if key not in data:
-            return False
-
-        del data[key]
-        self._save()
-        return True
+        self._resolved.pop(key, None)
+        self._unresolved.add(key)
+        cursor = self._db().execute("DELETE FROM resolutions WHERE key = ?", (key,))
+        return cursor.rowcount > 0
 
     def clear(self) -> int:
         """Clear all stored resolutions.
@@ -279,11 +548,9 @@ class ResolutionCache:
         Returns:
             Number of resolutions cleared.
         """
-        data = self._load()
-        count = len(data)
-        self._data = {}
-        self._save()
-        return count
+        self._resolved.clear()
+        self._unresolved.clear()
+        return self._db().execute("DELETE FROM resolutions").rowcount
 
     def count(self) -> int:
         """Get the number of stored resolutions.
@@ -291,4 +558,48 @@ class ResolutionCache:
         Returns:
             Number of resolutions.
         """
-        return len(self._load())
+        (count,) = self._db().execute("SELECT COUNT(*) FROM resolutions").fetchone()
+        return int(count)
+
+    def is_miss(self, song: Song) -> bool:
+        """Check if a song recently failed to match on Spotify.
+
+        Args:
+            song: The song to check.
+
+        Returns:
+            True if a miss was recorded within the TTL.
+        """
+        row = (
+            self._db()
+            .execute(
+                "SELECT checked_at FROM misses WHERE key = ?",
+                (_make_resolution_key(song),),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return False
+
+        age_days = (time.time() - int(row[0])) / 86400
+        return age_days <= self.miss_ttl_days
+
+    def add_miss(self, song: Song) -> None:
+        """Record that a song could not be matched on Spotify.
+
+        Args:
+            song: The song that was not found.
+        """
+        self._db().execute(
+            "INSERT INTO misses (key, checked_at) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET checked_at = excluded.checked_at",
+            (_make_resolution_key(song), int(time.time())),
+        )
+
+    def clear_misses(self) -> int:
+        """Forget every recorded miss, so those songs are searched again.
+
+        Returns:
+            Number of misses cleared.
+        """
+        return self._db().execute("DELETE FROM misses").rowcount
@@ -1,17 +1,25 @@
-"""Click-based CLI for KUTX to Spotify integration."""
+"""Click-based CLI for KUTX to Spotify integration.
+
+The KUTX, Spotify and browser clients pull in httpx, spotipy and
+Playwright, so they are imported where they are used to keep --help and
+argument errors fast.
+"""
+
+from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
 from datetime import datetime, time
-from typing import Any
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any
 
 import click
 
-from kutx2spotify.browser import SpotifyBrowser, select_best_match
 from kutx2spotify.cache import KUTXCache, ResolutionCache
-from kutx2spotify.kutx import KUTXClient
-from kutx2spotify.matcher import Matcher
 from kutx2spotify.models import MatchResult, Song
 from kutx2spotify.output import (
+    buffered_output,
     print_browser_header,
     print_browser_summary,
     print_browser_track_added,
@@ -25,7 +33,13 @@ from kutx2spotify.output import (
     print_playlist_header,
     print_summary,
 )
-from kutx2spotify.spotify import SpotifyClient
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from kutx2spotify.browser import SelectionResult, SpotifyBrowser
+    from kutx2spotify.kutx import KUTXClient
+    from kutx2spotify.spotify import SpotifyClient
 
 
 def parse_date(date_str: str) -> datetime:
@@ -41,6 +55,17 @@ def parse_date(date_str: str) -> datetime:
         click.BadParameter: If the date format is invalid.
     """
     try:
+        # Fast path for the canonical zero-padded form; strptime handles the rest
+        if (
+            len(date_str) == 10
+            and date_str[4] == "-"
+            and date_str[7] == "-"
+            and date_str.isascii()
+            and date_str[:4].isdigit()
+            and date_str[5:7].isdigit()
+            and date_str[8:].isdigit()
+        ):
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
         return datetime.strptime(date_str, "%Y-%m-%d")
     except ValueError as e:
         raise click.BadParameter(
@@ -61,8 +86,16 @@ def parse_time(time_str: str) -> time:
         click.BadParameter: If the time format is invalid.
     """
     try:
-        parsed = datetime.strptime(time_str, "%H:%M")
-        return parsed.time()
+        # Fast path for the canonical zero-padded form; strptime handles the rest
+        if (
+            len(time_str) == 5
+            and time_str[2] == ":"
+            and time_str.isascii()
+            and time_str[:2].isdigit()
+            and time_str[3:].isdigit()
+        ):
+            return time(int(time_str[:2]), int(time_str[3:]))
+        return datetime.strptime(time_str, "%H:%M").time()
     except ValueError as e:
         raise click.BadParameter(
             f"Invalid time format: {time_str}. Expected HH:MM."
@@ -220,20 +253,31 @@ def main(
         resolutions.append(parse_resolve(r))
 
     # Setup clients and caches
+    from kutx2spotify.kutx import KUTXClient
+    from kutx2spotify.spotify import SpotifyClient
+
     kutx_client = KUTXClient()
     kutx_cache = KUTXCache() if cached else None
-    resolution_cache = ResolutionCache()
+    if kutx_cache is not None:
+        # Days past the TTL are never read again
+        kutx_cache.clear_expired()
     spotify_client = SpotifyClient()
 
-    # Fetch songs
-    songs = _fetch_songs(
-        kutx_client=kutx_client,
-        kutx_cache=kutx_cache,
-        date=date,
-        start_time=start,
-        end_time=end,
-        use_cache=cached,
-    )
+    # Fetch songs, refreshing the Spotify token meanwhile unless the
+    # browser handles Spotify instead
+    try:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            spotify_ready = None if browser else pool.submit(spotify_client.prepare)
+            songs = _fetch_songs(
+                kutx_client=kutx_client,
+                kutx_cache=kutx_cache,
+                date=date,
+                start_time=start,
+                end_time=end,
+                use_cache=cached,
+            )
+    finally:
+        kutx_client.close()
 
     if not songs:
         print_error("No songs found for the specified date/time range.")
@@ -243,37 +287,44 @@ def main(
 
     # Browser mode: use Playwright instead of API
     if browser:
-        playlist_name = name or f"KUTX {date.strftime('%Y-%m-%d')}"
+        playlist_name = name or f"KUTX {date.date().isoformat()}"
         asyncio.run(_run_browser_workflow(songs, playlist_name, force_login=login))
         return
 
     # Match songs
-    matcher = Matcher(
-        spotify_client=spotify_client,
-        resolution_cache=resolution_cache,
-    )
-    result = matcher.match_songs(songs)
+    from kutx2spotify.matcher import Matcher
+
+    if spotify_ready is not None:
+        spotify_ready.result()
+
+    with ResolutionCache() as resolution_cache:
+        matcher = Matcher(
+            spotify_client=spotify_client,
+            resolution_cache=resolution_cache,
+        )
+        result = matcher.match_songs(songs)
 
     # Apply manual resolutions from CLI
     result = _apply_cli_resolutions(result, resolutions)
 
     # Format time strings for display
-    start_str = start.strftime("%H:%M") if start else None
-    end_str = end.strftime("%H:%M") if end else None
-    date_str = date.strftime("%Y-%m-%d")
+    start_str = start.isoformat(timespec="minutes") if start else None
+    end_str = end.isoformat(timespec="minutes") if end else None
+    date_str = date.date().isoformat()
 
     # Print output
-    print_playlist_header(date_str, start_str, end_str)
-    print_match_list(result)
-    print_issues(result)
+    with buffered_output():
+        print_playlist_header(date_str, start_str, end_str)
+        print_match_list(result)
+        print_issues(result)
 
-    if manual:
-        print_manual_links(result)
-        print_summary(result, preview=True)
-        return
+        if manual:
+            print_manual_links(result)
 
-    if preview:
-        print_summary(result, preview=True)
+        if manual or preview:
+            print_summary(result, preview=True)
+
+    if manual or preview:
         return
 
     # Create playlist
@@ -285,6 +336,43 @@ def main(
     )
 
 
+async def _select_tracks(
+    browser: SpotifyBrowser, songs: list[Song]
+) -> AsyncGenerator[tuple[Song, SelectionResult], None]:
+    """Search the browser for each song, one song ahead of the caller.
+
+    Searches alternate between two pages and a result stays clickable until
+    its page navigates again, so the next song's search can run while the
+    caller adds the current one. Only one search runs ahead at a time.
+
+    Args:
+        browser: Logged-in Spotify browser.
+        songs: Songs to search for.
+
+    Yields:
+        Each song with its best match, in order.
+    """
+    from kutx2spotify.browser import select_best_match
+
+    async def find(song: Song) -> SelectionResult:
+        results = await browser.search_tracks(f"{song.artist} {song.title}")
+        return select_best_match(results, song.album, song.duration_ms)
+
+    if not songs:
+        return
+
+    upcoming = asyncio.ensure_future(find(songs[0]))
+    try:
+        for current, following in pairwise(songs):
+            selection = await upcoming
+            upcoming = asyncio.ensure_future(find(following))
+            yield current, selection
+        yield songs[-1], await upcoming
+    finally:
+        # Stop the search running ahead if the caller quits early
+        upcoming.cancel()
+
+
 async def _run_browser_workflow(
     songs: list[Song], playlist_name: str, force_login: bool
 ) -> None:
@@ -295,6 +383,8 @@ async def _run_browser_workflow(
         playlist_name: Name for the new playlist.
         force_login: Force fresh login instead of using saved cookies.
     """
+    from kutx2spotify.browser import SpotifyBrowser
+
     async with SpotifyBrowser() as browser:
         # Login
         logged_in = await browser.ensure_logged_in(force_login=force_login)
@@ -313,23 +403,24 @@ async def _run_browser_workflow(
         added = 0
         skipped = 0
 
-        for i, song in enumerate(songs, 1):
-            query = f"{song.artist} {song.title}"
-            results = await browser.search_tracks(query)
-            selection = select_best_match(results, song.album, song.duration_ms)
-
-            if selection.selected is None:
-                print_browser_track_skipped(i, song, "no results")
-                skipped += 1
-                continue
+        i = 0
+        async with aclosing(_select_tracks(browser, songs)) as selections:
+            async for song, selection in selections:
+                i += 1
+                if selection.selected is None:
+                    print_browser_track_skipped(i, song, "no results")
+                    skipped += 1
+                    continue
 
-            try:
-                await browser.add_to_current_playlist(selection.selected, playlist_name)
-                print_browser_track_added(i, song, selection)
-                added += 1
-            except Exception:
-                print_browser_track_skipped(i, song, "failed to add")
-                skipped += 1
+                try:
+                    await browser.add_to_current_playlist(
+                        selection.selected, playlist_name
+                    )
+                    print_browser_track_added(i, song, selection)
+                    added += 1
+                except Exception:
+                    print_browser_track_skipped(i, song, "failed to add")
+                    skipped += 1
 
         print_browser_summary(added, skipped, playlist_url)
 
@@ -341,7 +432,7 @@ def _fetch_songs(
     start_time: time | None,
     end_time: time | None,
     use_cache: bool,
-) -> list[Any]:
+) -> list[Song]:
     """Fetch songs from KUTX, optionally using cache.
 
     Args:
@@ -366,25 +457,20 @@ def _fetch_songs(
     # Fetch from API if no cache hit
     if songs is None:
         print_info("Fetching from KUTX...")
-        songs = kutx_client.fetch_range(date, start_time, end_time)
-
-        # Cache the fetched data
-        if kutx_cache:
-            kutx_cache.set(date, songs)
-    else:
-        # Apply time filter to cached data
-        if start_time or end_time:
-            filtered = []
-            for song in songs:
-                song_time = song.played_at.time()
-                if start_time and song_time < start_time:
-                    continue
-                if end_time and song_time > end_time:
-                    continue
-                filtered.append(song)
-            songs = filtered
+        if kutx_cache is None:
+            return kutx_client.fetch_range(date, start_time, end_time)
+
+        # Cache the whole day, so any time range can be served from it later
+        songs = kutx_client.fetch_day(date)
+        kutx_cache.set(date, songs)
+
+    if start_time is None and end_time is None:
+        return songs
+
+    # Apply time filter to the whole day
+    from kutx2spotify.kutx import filter_time_range
 
-    return songs
+    return filter_time_range(songs, date, start_time, end_time)
 
 
 def _apply_cli_resolutions(
@@ -443,12 +529,12 @@ def _create_playlist(
         raise SystemExit(1)
 
     # Generate playlist name
-    playlist_name = name or f"KUTX {date.strftime('%Y-%m-%d')}"
+    playlist_name = name or f"KUTX {date.date().isoformat()}"
 
     # Create playlist and add tracks
     playlist_id = spotify_client.create_playlist(
         name=playlist_name,
-        description=f"KUTX playlist from {date.strftime('%Y-%m-%d')}",
+        description=f"KUTX playlist from {date.date().isoformat()}",
     )
     added_count = spotify_client.add_tracks(playlist_id, track_uris)
     playlist_url = spotify_client.get_playlist_url(playlist_id)
@@ -1,9 +1,14 @@
 """KUTX API client for fetching playlist data."""
 
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
 from datetime import datetime, time
+from operator import attrgetter
 from typing import Any
 
 import httpx
+import orjson
 
 from kutx2spotify.models import Song
 
@@ -11,17 +16,126 @@ KUTX_API_URL = (
     "https://api.composer.nprstations.org/v1/widget/50ef24ebe1c8a1369593d032/day"
 )
 
+# Seconds to wait for the KUTX API before giving up on a request
+REQUEST_TIMEOUT_S = 30.0
+
+# Idle connections kept open for later requests (one per fetch worker is plenty)
+MAX_KEEPALIVE_CONNECTIONS = 8
+
+_played_at = attrgetter("played_at")
+
+
+def _parse_start_time(value: str) -> datetime:
+    """Parse a KUTX start time ("MM-DD-YYYY HH:MM:SS").
+
+    The zero-padded form the API sends is rearranged into ISO 8601 for
+    datetime.fromisoformat(); anything else goes through strptime().
+
+    Args:
+        value: Start time string from the API.
+
+    Returns:
+        Parsed naive datetime.
+
+    Raises:
+        ValueError: If the string is not a valid start time.
+    """
+    if (
+        len(value) == 19
+        and value[2] == "-"
+        and value[5] == "-"
+        and value[10] == " "
+        and value[13] == ":"
+        and value[16] == ":"
+    ):
+        return datetime.fromisoformat(
+            f"{value[6:10]}-{value[:2]}-{value[3:5]}T{value[11:]}"
+        )
+    return datetime.strptime(value, "%m-%d-%Y %H:%M:%S")
+
+
+def filter_time_range(
+    songs: list[Song],
+    date: datetime,
+    start_time: time | None = None,
+    end_time: time | None = None,
+) -> list[Song]:
+    """Select the songs played within a time range on a given date.
+
+    Args:
+        songs: Songs sorted by play time.
+        date: The date the time range applies to.
+        start_time: Start of time range (inclusive). None means start of day.
+        end_time: End of time range (inclusive). None means end of day.
+
+    Returns:
+        The slice of songs played within the time range.
+    """
+    day = date.date()
+    lo = (
+        0
+        if start_time is None
+        else bisect_left(songs, datetime.combine(day, start_time), key=_played_at)
+    )
+    hi = (
+        len(songs)
+        if end_time is None
+        else bisect_right(songs, datetime.combine(day, end_time), key=_played_at)
+    )
+    return songs[lo:hi]
+
 
 class KUTXClient:
-    """Client for fetching KUTX playlist data."""
+    """Client for fetching KUTX playlist data.
+
+    One HTTP connection pool is shared by every request the client makes,
+    so fetching several days pays for the TLS handshake once. Call close(),
+    or use the client as a context manager, to release it.
+    """
 
     def __init__(self, base_url: str = KUTX_API_URL) -> None:
         """Initialize the KUTX client.
 
+        The HTTP connection pool is created on first use.
+
         Args:
             base_url: Base URL for the KUTX API.
         """
         self.base_url = base_url
+        self._http: httpx.Client | None = None
+        # Days may be fetched from a thread pool; only one may build the pool
+        self._http_lock = threading.Lock()
+
+    def __enter__(self) -> "KUTXClient":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit context manager, closing open connections."""
+        self.close()
+
+    def _get_http(self) -> httpx.Client:
+        """Get the shared HTTP client, creating it if needed.
+
+        Returns:
+            HTTP client with a keep-alive connection pool.
+        """
+        with self._http_lock:
+            if self._http is None:
+                self._http = httpx.Client(
+                    timeout=REQUEST_TIMEOUT_S,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+                    ),
+                )
+        return self._http
+
+    def close(self) -> None:
+        """Close open connections. The client can still be used afterwards."""
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
 
     def _parse_song(self, track_data: dict[str, Any]) -> Song | None:
         """Parse a song from API response data.
@@ -32,22 +146,22 @@ class KUTXClient:
         Returns:
             Parsed Song or None if essential fields are missing.
         """
-        title = track_data.get("trackName")
-        artist = track_data.get("artistName")
+        try:
+            title = track_data["trackName"]
+            artist = track_data["artistName"]
+            # "MM-DD-YYYY HH:MM:SS"
+            start_time_str = track_data["_start_time"]
+        except KeyError:
+            return None
 
-        if not title or not artist:
+        if not title or not artist or not start_time_str:
             return None
 
         album = track_data.get("collectionName", "")
         duration_ms = track_data.get("_duration", 0)
 
-        # Parse start time: "MM-DD-YYYY HH:MM:SS"
-        start_time_str = track_data.get("_start_time", "")
-        if not start_time_str:
-            return None
-
         try:
-            played_at = datetime.strptime(start_time_str, "%m-%d-%Y %H:%M:%S")
+            played_at = _parse_start_time(start_time_str)
         except ValueError:
             return None
 
@@ -59,37 +173,44 @@ class KUTXClient:
             played_at=played_at,
         )
 
-    def fetch_day(self, date: datetime) -> list[Song]:
-        """Fetch all songs played on a given date.
+    def _iter_day(self, date: datetime) -> Iterator[Song]:
+        """Fetch the playlist for a date and yield songs as they are parsed.
 
         Args:
             date: The date to fetch playlist for.
 
-        Returns:
-            List of songs played on that date.
+        Yields:
+            Songs in the order the API lists them.
         """
         params = {
-            "date": date.strftime("%Y-%m-%d"),
+            "date": date.date().isoformat(),
             "format": "json",
         }
 
-        with httpx.Client() as client:
-            response = client.get(self.base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = self._get_http().get(self.base_url, params=params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         # API returns playlists nested inside onToday array
         # Each element in onToday is a program block with its own playlist
-        on_today = data.get("onToday", [])
-        songs: list[Song] = []
-
-        for program_block in on_today:
-            playlist = program_block.get("playlist", [])
-            for track_data in playlist:
+        for program_block in data.get("onToday", []):
+            for track_data in program_block.get("playlist", []):
                 song = self._parse_song(track_data)
                 if song is not None:
-                    songs.append(song)
+                    yield song
+
+    def fetch_day(self, date: datetime) -> list[Song]:
+        """Fetch all songs played on a given date.
+
+        Args:
+            date: The date to fetch playlist for.
 
+        Returns:
+            List of songs played on that date, in play order.
+        """
+        songs = list(self._iter_day(date))
+        # Blocks normally arrive in order, which makes this sort a single pass
+        songs.sort(key=_played_at)
         return songs
 
     def fetch_range(
@@ -100,29 +221,25 @@ class KUTXClient:
     ) -> list[Song]:
         """Fetch songs within a time range on a given date.
 
+        Songs are filtered as they are parsed, so the rest of the day is
+        never collected or sorted.
+
         Args:
             date: The date to fetch playlist for.
             start_time: Start of time range (inclusive). None means start of day.
             end_time: End of time range (inclusive). None means end of day.
 
         Returns:
-            List of songs played within the time range.
+            List of songs played within the time range, in play order.
         """
-        songs = self.fetch_day(date)
-
         if start_time is None and end_time is None:
-            return songs
-
-        filtered: list[Song] = []
-        for song in songs:
-            song_time = song.played_at.time()
+            return self.fetch_day(date)
 
-            if start_time is not None and song_time < start_time:
-                continue
-
-            if end_time is not None and song_time > end_time:
-                continue
-
-            filtered.append(song)
-
-        return filtered
+        day = date.date()
+        first = (
+            datetime.min if start_time is None else datetime.combine(day, start_time)
+        )
+        last = datetime.max if end_time is None else datetime.combine(day, end_time)
+        songs = [s for s in self._iter_day(date) if first <= s.played_at <= last]
+        songs.sort(key=_played_at)
+        return songs
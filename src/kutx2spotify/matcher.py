@@ -1,18 +1,54 @@
 """Song matching engine for KUTX to Spotify integration."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from kutx2spotify.cache import ResolutionCache
-from kutx2spotify.models import Match, MatchResult, MatchStatus, Song, SpotifyTrack
+from kutx2spotify.models import (
+    Match,
+    MatchResult,
+    MatchStatus,
+    Song,
+    SpotifyTrack,
+    normalize_text,
+)
 from kutx2spotify.spotify import SpotifyClient
 
 # Duration tolerance in milliseconds (10 seconds)
 DURATION_TOLERANCE_MS = 10_000
 
+# Maximum Spotify searches in flight at once, to stay under the rate limit
+MAX_SEARCH_WORKERS = 10
+
+# Status of a found track by (album matches, duration within tolerance);
+# a duration mismatch is flagged whether or not the album matches
+_STATUS_BY_OUTCOME: dict[tuple[bool, bool], MatchStatus] = {
+    (True, True): MatchStatus.EXACT,
+    (True, False): MatchStatus.DURATION_MISMATCH,
+    (False, True): MatchStatus.ALBUM_FALLBACK,
+    (False, False): MatchStatus.DURATION_MISMATCH,
+}
+
+# Everything a Spotify search and its match status depend on
+SearchKey = tuple[str, str, str, int]
+
+
+def _search_key(song: Song) -> SearchKey:
+    """Get the fields that determine how a song matches.
+
+    Args:
+        song: The KUTX song.
+
+    Returns:
+        Tuple of title, artist, album and duration.
+    """
+    return (song.title, song.artist, song.album, song.duration_ms)
+
 
 class Matcher:
     """Matches KUTX songs to Spotify tracks.
 
     Matching algorithm:
-    1. Check resolution cache first (user-stored decisions)
+    1. Check resolution cache first (user-stored decisions and recent misses)
     2. Exact match: search with album, verify album matches
     3. Album fallback: search without album if exact not found
     4. Duration filter: prefer tracks within +/- 10 seconds
@@ -32,9 +68,15 @@ class Matcher:
         """
         self._spotify = spotify_client
         self._cache = resolution_cache
+        # Fallback candidates by (title, artist), so songs that differ only
+        # in album share one search
+        self._candidates: dict[tuple[str, str], list[SpotifyTrack]] = {}
 
     def _albums_match(self, kutx_album: str, spotify_album: str) -> bool:
-        """Check if albums match (case-insensitive).
+        """Check if albums match (ignoring case and spacing).
+
+        Songs and tracks carry a precomputed album_key; compare those directly
+        where both are at hand.
 
         Args:
             kutx_album: Album name from KUTX.
@@ -43,7 +85,7 @@ class Matcher:
         Returns:
             True if albums match.
         """
-        return kutx_album.lower() == spotify_album.lower()
+        return normalize_text(kutx_album) == normalize_text(spotify_album)
 
     def _is_within_duration_tolerance(self, song: Song, track: SpotifyTrack) -> bool:
         """Check if track duration is within tolerance of song duration.
@@ -67,6 +109,11 @@ class Matcher:
         Returns:
             SpotifyTrack if exact match found, None otherwise.
         """
+        # Without an album this is the fallback query cut to one result,
+        # whose album would have to be empty to count as exact
+        if not song.album:
+            return None
+
         track = self._spotify.search_track(
             title=song.title,
             artist=song.artist,
@@ -77,7 +124,7 @@ class Matcher:
             return None
 
         # Verify album actually matches
-        if not self._albums_match(song.album, track.album):
+        if song.album_key != track.album_key:
             return None
 
         return track
@@ -94,33 +141,36 @@ class Matcher:
             Tuple of (best track or None, within_tolerance bool).
             within_tolerance is True if track is within duration tolerance.
         """
-        tracks = self._spotify.search_tracks(
-            title=song.title,
-            artist=song.artist,
-        )
+        key = (song.title, song.artist)
+        tracks = self._candidates.get(key)
+        if tracks is None:
+            tracks = self._spotify.search_tracks(
+                title=song.title,
+                artist=song.artist,
+            )
+            self._candidates[key] = tracks
 
         if not tracks:
             return None, False
 
-        # Separate tracks into within-tolerance and outside-tolerance
-        within_tolerance = [
-            t for t in tracks if self._is_within_duration_tolerance(song, t)
-        ]
-        outside_tolerance = [
-            t for t in tracks if not self._is_within_duration_tolerance(song, t)
-        ]
-
-        # Prefer tracks within tolerance, sorted by popularity
-        if within_tolerance:
-            best = max(within_tolerance, key=lambda t: t.popularity)
-            return best, True
-
-        # Fall back to outside tolerance, sorted by popularity
-        if outside_tolerance:
-            best = max(outside_tolerance, key=lambda t: t.popularity)
-            return best, False
-
-        return None, False
+        # Most popular track within tolerance and outside it, in one pass;
+        # the first of equally popular tracks wins, as with max()
+        shortest = song.duration_ms - DURATION_TOLERANCE_MS
+        longest = song.duration_ms + DURATION_TOLERANCE_MS
+        best_within: SpotifyTrack | None = None
+        best_outside: SpotifyTrack | None = None
+        for track in tracks:
+            if shortest <= track.duration_ms <= longest:
+                if best_within is None or track.popularity > best_within.popularity:
+                    best_within = track
+            elif best_outside is None or track.popularity > best_outside.popularity:
+                best_outside = track
+
+        # Prefer tracks within tolerance
+        if best_within is not None:
+            return best_within, True
+
+        return best_outside, False
 
     def _check_resolution_cache(self, song: Song) -> Match | None:
         """Check if song has a cached resolution.
@@ -158,6 +208,33 @@ class Matcher:
 
         return Match(song=song, track=track, status=status)
 
+    def _check_caches(self, song: Song) -> Match | None:
+        """Check the resolution cache for a decision or a recent miss.
+
+        Args:
+            song: The KUTX song to check.
+
+        Returns:
+            Match if the cache settles the song, None if it must be searched.
+        """
+        cached = self._check_resolution_cache(song)
+        if cached is not None:
+            return cached
+
+        if self._cache is not None and self._cache.is_miss(song):
+            return Match(song=song, track=None, status=MatchStatus.NOT_FOUND)
+
+        return None
+
+    def _record_miss(self, match: Match) -> None:
+        """Remember a search that found nothing, to skip it next run.
+
+        Args:
+            match: Result of searching Spotify for a song.
+        """
+        if self._cache is not None and match.status == MatchStatus.NOT_FOUND:
+            self._cache.add_miss(match.song)
+
     def match_song(self, song: Song) -> Match:
         """Match a single song to a Spotify track.
 
@@ -174,46 +251,37 @@ class Matcher:
             Match result with track and status.
         """
         # Step 1: Check resolution cache
-        cached = self._check_resolution_cache(song)
+        cached = self._check_caches(song)
         if cached is not None:
             return cached
 
-        # Step 2: Try exact match
-        exact_track = self._find_exact_match(song)
-        if exact_track is not None:
-            # Check duration for exact match
-            if self._is_within_duration_tolerance(song, exact_track):
-                return Match(song=song, track=exact_track, status=MatchStatus.EXACT)
-            else:
-                return Match(
-                    song=song, track=exact_track, status=MatchStatus.DURATION_MISMATCH
-                )
+        match = self._search_match(song)
+        self._record_miss(match)
+        return match
 
-        # Step 3: Try album fallback
-        fallback_track, within_tolerance = self._find_best_fallback(song)
-        if fallback_track is None:
-            return Match(song=song, track=None, status=MatchStatus.NOT_FOUND)
+    def _search_match(self, song: Song) -> Match:
+        """Match a song by searching Spotify, skipping the resolution cache.
 
-        # Check if album matches (could be exact after all)
-        if self._albums_match(song.album, fallback_track.album):
-            if within_tolerance:
-                return Match(song=song, track=fallback_track, status=MatchStatus.EXACT)
-            else:
-                return Match(
-                    song=song,
-                    track=fallback_track,
-                    status=MatchStatus.DURATION_MISMATCH,
-                )
-
-        # Album doesn't match - it's a fallback
-        if within_tolerance:
-            return Match(
-                song=song, track=fallback_track, status=MatchStatus.ALBUM_FALLBACK
-            )
+        Args:
+            song: The KUTX song to match.
+
+        Returns:
+            Match result with track and status.
+        """
+        # Step 2: Try exact match (its album matches by construction)
+        track = self._find_exact_match(song)
+        if track is not None:
+            within_tolerance = self._is_within_duration_tolerance(song, track)
         else:
-            return Match(
-                song=song, track=fallback_track, status=MatchStatus.DURATION_MISMATCH
-            )
+            # Step 3: Try album fallback
+            track, within_tolerance = self._find_best_fallback(song)
+            if track is None:
+                return Match(song=song, track=None, status=MatchStatus.NOT_FOUND)
+
+        # A fallback track may be on the right album after all
+        album_matches = song.album_key == track.album_key
+        status = _STATUS_BY_OUTCOME[album_matches, within_tolerance]
+        return Match(song=song, track=track, status=status)
 
     def match_songs(self, songs: list[Song]) -> MatchResult:
         """Match multiple songs to Spotify tracks.
@@ -221,6 +289,10 @@ class Matcher:
         Gracefully handles when Spotify is not configured by returning
         NOT_FOUND for all songs.
 
+        Each distinct song is looked up in the resolution cache on the
+        calling thread, and the rest are searched concurrently; repeats
+        share the result, and the result keeps the input order.
+
         Args:
             songs: List of KUTX songs to match.
 
@@ -235,9 +307,38 @@ class Matcher:
                 result.add(Match(song=song, track=None, status=MatchStatus.NOT_FOUND))
             return result
 
-        # Match each song
+        # Radio playlists repeat songs; look up each distinct one only once
+        distinct: dict[SearchKey, Song] = {}
+        for song in songs:
+            distinct.setdefault(_search_key(song), song)
+
+        # The resolution cache's connection belongs to this thread
+        settled: dict[SearchKey, Match] = {}
+        pending: dict[SearchKey, Song] = {}
+        for key, song in distinct.items():
+            cached = self._check_caches(song)
+            if cached is None:
+                pending[key] = song
+            else:
+                settled[key] = cached
+
+        if pending:
+            # Log in here, once, rather than in every worker at the same time
+            self._spotify.authorize()
+            workers = min(MAX_SEARCH_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                matches = pool.map(self._search_match, pending.values())
+                searched = dict(zip(pending, matches, strict=True))
+            for found in searched.values():
+                self._record_miss(found)
+            settled.update(searched)
+
         for song in songs:
-            match = self.match_song(song)
-            result.add(match)
+            found = settled[_search_key(song)]
+            result.add(
+                found
+                if found.song is song
+                else Match(song=song, track=found.track, status=found.status)
+            )
 
         return result
@@ -1,5 +1,6 @@
 """Data models for KUTX to Spotify integration."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -14,7 +15,33 @@ class MatchStatus(Enum):
     NOT_FOUND = "not_found"
 
 
-@dataclass(frozen=True)
+def normalize_text(text: str) -> str:
+    """Fold case and collapse runs of whitespace for comparison.
+
+    Args:
+        text: Text to normalize.
+
+    Returns:
+        The casefolded text with single spaces between words.
+    """
+    return " ".join(text.split()).casefold()
+
+
+def make_lookup_key(title: str, artist: str, album: str) -> str:
+    """Build a case- and whitespace-insensitive identity for a song.
+
+    Args:
+        title: Song title.
+        artist: Artist name.
+        album: Album name.
+
+    Returns:
+        The casefolded fields with runs of whitespace collapsed, joined by "|".
+    """
+    return "|".join(normalize_text(part) for part in (title, artist, album))
+
+
+@dataclass(frozen=True, slots=True)
 class Song:
     """A song from the KUTX playlist."""
 
@@ -23,6 +50,17 @@ class Song:
     album: str
     duration_ms: int
     played_at: datetime
+    # Case-insensitive identity, computed once for repeated cache lookups
+    lookup_key: str = field(init=False, repr=False, compare=False)
+    # Normalized album, computed once for repeated album comparisons
+    album_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the lookup and album keys."""
+        object.__setattr__(
+            self, "lookup_key", make_lookup_key(self.title, self.artist, self.album)
+        )
+        object.__setattr__(self, "album_key", normalize_text(self.album))
 
     @property
     def duration_seconds(self) -> int:
@@ -36,7 +74,7 @@ class Song:
         return f"{minutes}:{seconds:02d}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpotifyTrack:
     """A track from Spotify."""
 
@@ -47,9 +85,15 @@ class SpotifyTrack:
     album: str
     duration_ms: int
     popularity: int = 0
+    # Normalized album, computed once for repeated album comparisons
+    album_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the album key."""
+        object.__setattr__(self, "album_key", normalize_text(self.album))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Match:
     """A match between a KUTX song and a Spotify track."""
 
@@ -68,9 +112,26 @@ class Match:
 
 @dataclass
 class MatchResult:
-    """Aggregated results from matching songs to Spotify tracks."""
+    """Aggregated results from matching songs to Spotify tracks.
+
+    Counts are kept up to date as matches are added, so reading them does
+    not rescan the list; add matches with add() rather than appending to
+    matches directly.
+    """
 
     matches: list[Match] = field(default_factory=list)
+    _found: int = field(default=0, init=False, repr=False, compare=False)
+    _exact: int = field(default=0, init=False, repr=False, compare=False)
+    # Positions in matches of the matches with issues
+    _issue_indexes: list[int] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Count the matches the result was created with."""
+        initial, self.matches = self.matches, []
+        for match in initial:
+            self.add(match)
 
     @property
     def total(self) -> int:
@@ -80,23 +141,43 @@ class MatchResult:
     @property
     def found(self) -> int:
         """Number of songs that found a Spotify match."""
-        return sum(1 for m in self.matches if m.track is not None)
+        return self._found
 
     @property
     def not_found(self) -> int:
         """Number of songs without a Spotify match."""
-        return sum(1 for m in self.matches if m.track is None)
+        return len(self.matches) - self._found
 
     @property
     def exact_matches(self) -> int:
         """Number of exact matches."""
-        return sum(1 for m in self.matches if m.status == MatchStatus.EXACT)
+        return self._exact
+
+    @property
+    def issue_count(self) -> int:
+        """Number of matches with potential issues."""
+        return len(self._issue_indexes)
 
     @property
     def issues(self) -> list[Match]:
         """Matches with potential issues."""
-        return [m for m in self.matches if m.has_issue]
+        return [self.matches[i] for i in self._issue_indexes]
+
+    def iter_issues(self) -> Iterator[tuple[int, Match]]:
+        """Iterate over matches with potential issues without scanning them all.
+
+        Yields:
+            Each issue's 1-based position in matches, and the match.
+        """
+        for i in self._issue_indexes:
+            yield i + 1, self.matches[i]
 
     def add(self, match: Match) -> None:
         """Add a match to the results."""
         self.matches.append(match)
+        if match.track is not None:
+            self._found += 1
+        if match.status == MatchStatus.EXACT:
+            self._exact += 1
+        if match.has_issue:
+            self._issue_indexes.append(len(self.matches) - 1)
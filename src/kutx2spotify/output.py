@@ -1,16 +1,58 @@
 """Rich-based output formatting for CLI."""
 
-from urllib.parse import quote_plus
-
-from rich.console import Console
+import contextlib
+import functools
+import string
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+from urllib.parse import quote_from_bytes
+
+from rich.style import Style
 from rich.text import Text
 
-from kutx2spotify.browser import SelectionResult
 from kutx2spotify.models import Match, MatchResult, MatchStatus, Song
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    # Annotation only: importing browser at runtime would load Playwright
+    from kutx2spotify.browser import SelectionResult
+
+
+@functools.cache
+def _get_console() -> "Console":
+    """Get the shared console, creating it on first use.
+
+    Loading rich.console is most of the import cost of this module, and
+    --help never prints through it.
+
+    Returns:
+        The module's console.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+# Styles, parsed once instead of on every print
+_STYLE_BOLD = Style(bold=True)
+_STYLE_DIM = Style(dim=True)
+_STYLE_GREEN = Style(color="green")
+_STYLE_RED = Style(color="red")
+_STYLE_YELLOW = Style(color="yellow")
+_STYLE_BOLD_GREEN = Style(color="green", bold=True)
+_STYLE_BOLD_RED = Style(color="red", bold=True)
+_STYLE_BOLD_YELLOW = Style(color="yellow", bold=True)
 
+# Rule printed above the issues, manual links and summary sections
+_SECTION_RULE = "-" * 41
 
+# Characters quote_plus() leaves as they are, plus the space it turns into "+"
+_URL_SAFE = frozenset(string.ascii_letters + string.digits + "_.-~ ")
+
+
+# Song lengths cluster, and each is formatted for several output sections
+@functools.lru_cache(maxsize=4096)
 def format_duration(duration_ms: int) -> str:
     """Format duration in milliseconds as MM:SS.
 
@@ -20,12 +62,11 @@ def format_duration(duration_ms: int) -> str:
     Returns:
         Formatted string like "4:12".
     """
-    total_seconds = duration_ms // 1000
-    minutes = total_seconds // 60
-    seconds = total_seconds % 60
+    minutes, seconds = divmod(duration_ms // 1000, 60)
     return f"{minutes}:{seconds:02d}"
 
 
+@functools.lru_cache(maxsize=4096)
 def format_duration_diff(diff_ms: int) -> str:
     """Format duration difference with sign.
 
@@ -40,6 +81,19 @@ def format_duration_diff(diff_ms: int) -> str:
     return f"{sign}{diff_seconds}s"
 
 
+@functools.lru_cache(maxsize=64)
+def _underline(length: int) -> str:
+    """Build the rule printed under a header.
+
+    Args:
+        length: Header length in characters.
+
+    Returns:
+        A run of "=" of the given length.
+    """
+    return "=" * length
+
+
 def generate_spotify_search_url(title: str, artist: str) -> str:
     """Generate a Spotify search URL for manual searching.
 
@@ -51,10 +105,35 @@ def generate_spotify_search_url(title: str, artist: str) -> str:
         Spotify search URL.
     """
     query = f"{title} {artist}"
-    encoded_query = quote_plus(query)
+    if _URL_SAFE.issuperset(query):
+        # Most titles need nothing escaped; skip quoting for them
+        encoded_query = query.replace(" ", "+")
+    else:
+        # What quote_plus() does, minus its type checks and re-dispatch
+        encoded_query = quote_from_bytes(query.encode(), safe=" ").replace(" ", "+")
     return f"https://open.spotify.com/search/{encoded_query}"
 
 
+@contextlib.contextmanager
+def buffered_output() -> Iterator[None]:
+    """Hold console output back and write it once when leaving the block.
+
+    Rich writes and flushes on every print, which is slow when output is
+    redirected to a file or pipe. A terminal still gets each line as it is
+    printed.
+
+    Yields:
+        None.
+    """
+    console = _get_console()
+    if console.is_terminal:
+        yield
+        return
+
+    with console:
+        yield
+
+
 def print_playlist_header(
     date_str: str,
     start_time: str | None = None,
@@ -67,6 +146,7 @@ def print_playlist_header(
         start_time: Start time string (e.g., "14:00"). Optional.
         end_time: End time string (e.g., "18:00"). Optional.
     """
+    console = _get_console()
     if start_time and end_time:
         header = f"KUTX Playlist: {date_str} {start_time} - {end_time}"
     elif start_time:
@@ -77,19 +157,29 @@ def print_playlist_header(
         header = f"KUTX Playlist: {date_str}"
 
     console.print()
-    console.print(header, style="bold")
-    console.print("=" * len(header))
+    console.print(header, style=_STYLE_BOLD)
+    console.print(_underline(len(header)))
     console.print()
 
 
 def print_match_list(result: MatchResult) -> None:
     """Print the list of matches with asterisks for issues.
 
+    All lines are printed with a single console write.
+
     Args:
         result: MatchResult containing all matches.
     """
-    for idx, match in enumerate(result.matches, 1):
-        _print_match_line(idx, match)
+    console = _get_console()
+    if not result.matches:
+        return
+
+    console.print(
+        Text("\n").join(
+            _format_match_line(idx, match)
+            for idx, match in enumerate(result.matches, 1)
+        )
+    )
 
 
 def _print_match_line(idx: int, match: Match) -> None:
@@ -99,28 +189,38 @@ def _print_match_line(idx: int, match: Match) -> None:
         idx: 1-based index.
         match: The match to print.
     """
-    song = match.song
-    prefix = "*" if match.has_issue else " "
-    duration = format_duration(song.duration_ms)
+    _get_console().print(_format_match_line(idx, match))
 
-    # Build the line: "* 3. Title - Artist (Album) [4:12]"
-    line = Text()
-    line.append(f"{prefix} ")
-
-    if match.has_issue:
-        line.append(f"{idx:2d}. ", style="yellow bold")
-    else:
-        line.append(f"{idx:2d}. ")
 
-    line.append(f"{song.title}", style="bold" if not match.has_issue else "yellow bold")
-    line.append(f" - {song.artist}")
+def _format_match_line(idx: int, match: Match) -> Text:
+    """Build a single match line.
 
-    if song.album:
-        line.append(f" ({song.album})", style="dim")
+    Args:
+        idx: 1-based index.
+        match: The match to format.
 
-    line.append(f" [{duration}]", style="dim")
+    Returns:
+        Styled line of text.
+    """
+    song = match.song
+    song_album = song.album
+    album = f" ({song_album})" if song_album else ""
+    details = (f"{album} [{format_duration(song.duration_ms)}]", _STYLE_DIM)
 
-    console.print(line)
+    # Build the line: "* 3. Title - Artist (Album) [4:12]"
+    if match.has_issue:
+        return Text.assemble(
+            "* ",
+            (f"{idx:2d}. {song.title}", _STYLE_BOLD_YELLOW),
+            f" - {song.artist}",
+            details,
+        )
+    return Text.assemble(
+        f"  {idx:2d}. ",
+        (song.title, _STYLE_BOLD),
+        f" - {song.artist}",
+        details,
+    )
 
 
 def print_issues(result: MatchResult) -> None:
@@ -129,19 +229,17 @@ def print_issues(result: MatchResult) -> None:
     Args:
         result: MatchResult containing all matches.
     """
-    issues = result.issues
-    if not issues:
+    console = _get_console()
+    if not result.issue_count:
         return
 
     console.print()
-    console.print("-" * 41)
+    console.print(_SECTION_RULE)
     console.print(f"Exact matches: {result.exact_matches}/{result.total}")
     console.print()
-    console.print("ISSUES:", style="bold yellow")
+    console.print("ISSUES:", style=_STYLE_BOLD_YELLOW)
 
-    for idx, match in enumerate(result.matches, 1):
-        if not match.has_issue:
-            continue
+    for idx, match in result.iter_issues():
         _print_issue_detail(idx, match)
 
 
@@ -152,17 +250,19 @@ def _print_issue_detail(idx: int, match: Match) -> None:
         idx: 1-based index of the match.
         match: The match with an issue.
     """
+    console = _get_console()
     song = match.song
+    title = song.title
+    artist = song.artist
     track = match.track
+    status = match.status
 
-    console.print(f"* #{idx}: {song.title} - {song.artist}", style="yellow")
+    console.print(f"* #{idx}: {title} - {artist}", style=_STYLE_YELLOW)
 
-    if match.status == MatchStatus.NOT_FOUND:
-        console.print("  Not found on Spotify", style="red")
-        console.print(
-            f"  Search: {generate_spotify_search_url(song.title, song.artist)}"
-        )
-    elif match.status == MatchStatus.DURATION_MISMATCH and track:
+    if status is MatchStatus.NOT_FOUND:
+        console.print("  Not found on Spotify", style=_STYLE_RED)
+        console.print(f"  Search: {generate_spotify_search_url(title, artist)}")
+    elif status is MatchStatus.DURATION_MISMATCH and track is not None:
         console.print(f"  KUTX album: {song.album}")
         diff_ms = track.duration_ms - song.duration_ms
         track_duration = format_duration(track.duration_ms)
@@ -174,18 +274,31 @@ def _print_issue_detail(idx: int, match: Match) -> None:
 def print_manual_links(result: MatchResult) -> None:
     """Print Spotify search links for manual mode.
 
+    The links are printed with a single console write.
+
     Args:
         result: MatchResult containing all matches.
     """
+    console = _get_console()
     console.print()
-    console.print("Manual Search Links:", style="bold")
-    console.print("-" * 41)
+    console.print("Manual Search Links:", style=_STYLE_BOLD)
+    console.print(_SECTION_RULE)
+
+    if not result.matches:
+        return
 
+    links = Text()
     for idx, match in enumerate(result.matches, 1):
         song = match.song
-        url = generate_spotify_search_url(song.title, song.artist)
-        console.print(f"{idx:2d}. {song.title} - {song.artist}")
-        console.print(f"    {url}", style="dim")
+        title = song.title
+        artist = song.artist
+        url = generate_spotify_search_url(title, artist)
+        if idx > 1:
+            links.append("\n")
+        links.append(f"{idx:2d}. {title} - {artist}\n")
+        links.append(f"    {url}", style=_STYLE_DIM)
+    # Highlight numbers and URLs as console.print() does for plain strings
+    console.print(console.highlighter(links))
 
 
 def print_summary(result: MatchResult, preview: bool = False) -> None:
@@ -195,11 +308,12 @@ def print_summary(result: MatchResult, preview: bool = False) -> None:
         result: MatchResult containing all matches.
         preview: Whether this is a preview run (no Spotify changes).
     """
+    console = _get_console()
     console.print()
-    console.print("-" * 41)
+    console.print(_SECTION_RULE)
 
     if preview:
-        console.print("[Preview mode - no changes made]", style="dim")
+        console.print("[Preview mode - no changes made]", style=_STYLE_DIM)
         console.print()
 
     console.print(f"Total tracks: {result.total}")
@@ -207,11 +321,11 @@ def print_summary(result: MatchResult, preview: bool = False) -> None:
     console.print(f"Not found: {result.not_found}")
     console.print(f"Exact matches: {result.exact_matches}")
 
-    issues_count = len(result.issues)
+    issues_count = result.issue_count
     if issues_count > 0:
-        console.print(f"Issues: {issues_count}", style="yellow")
+        console.print(f"Issues: {issues_count}", style=_STYLE_YELLOW)
     else:
-        console.print("Issues: 0", style="green")
+        console.print("Issues: 0", style=_STYLE_GREEN)
 
 
 def print_playlist_created(url: str, name: str, track_count: int) -> None:
@@ -222,8 +336,9 @@ def print_playlist_created(url: str, name: str, track_count: int) -> None:
         name: Playlist name.
         track_count: Number of tracks added.
     """
+    console = _get_console()
     console.print()
-    console.print("Playlist created!", style="bold green")
+    console.print("Playlist created!", style=_STYLE_BOLD_GREEN)
     console.print(f"Name: {name}")
     console.print(f"Tracks: {track_count}")
     console.print(f"URL: {url}")
@@ -235,7 +350,7 @@ def print_error(message: str) -> None:
     Args:
         message: Error message to print.
     """
-    console.print(f"Error: {message}", style="bold red")
+    _get_console().print(f"Error: {message}", style=_STYLE_BOLD_RED)
 
 
 def print_warning(message: str) -> None:
@@ -244,7 +359,7 @@ def print_warning(message: str) -> None:
     Args:
         message: Warning message to print.
     """
-    console.print(f"Warning: {message}", style="yellow")
+    _get_console().print(f"Warning: {message}", style=_STYLE_YELLOW)
 
 
 def print_info(message: str) -> None:
@@ -253,7 +368,7 @@ def print_info(message: str) -> None:
     Args:
         message: Info message to print.
     """
-    console.print(message, style="dim")
+    _get_console().print(message, style=_STYLE_DIM)
 
 
 def print_browser_header(playlist_name: str) -> None:
@@ -262,14 +377,15 @@ def print_browser_header(playlist_name: str) -> None:
     Args:
         playlist_name: Name of the playlist being created.
     """
+    console = _get_console()
     console.print()
-    console.print(f"Creating playlist: {playlist_name} (private)", style="bold")
+    console.print(f"Creating playlist: {playlist_name} (private)", style=_STYLE_BOLD)
     console.print()
     console.print("Adding songs...")
 
 
 def print_browser_track_added(
-    index: int, song: Song, selection: SelectionResult
+    index: int, song: Song, selection: "SelectionResult"
 ) -> None:
     """Print track addition result with reason and alternatives.
 
@@ -278,6 +394,7 @@ def print_browser_track_added(
         song: The original song from KUTX.
         selection: The selection result containing the matched track.
     """
+    console = _get_console()
     if selection.selected is None:
         return
 
@@ -287,22 +404,22 @@ def print_browser_track_added(
     # Format the base info
     line = Text()
     line.append(f"  {index:2d}. ")
-    line.append("[green]v[/green] ", style="green")
+    line.append("[green]v[/green] ", style=_STYLE_GREEN)
     line.append(f"{song.title} - {song.artist}")
 
     # Add selection reason
     if reason == "exact_match":
-        line.append(f" [{reason}]", style="dim")
+        line.append(f" [{reason}]", style=_STYLE_DIM)
     elif reason == "album_match":
         diff_ms = selected.duration_ms - song.duration_ms
         diff_str = format_duration_diff(diff_ms)
-        line.append(f" [{reason}: {diff_str}]", style="dim")
+        line.append(f" [{reason}: {diff_str}]", style=_STYLE_DIM)
     elif reason == "duration_match":
         line.append(
-            f' [{reason}: "{selected.album}" vs "{song.album}"]', style="yellow"
+            f' [{reason}: "{selected.album}" vs "{song.album}"]', style=_STYLE_YELLOW
         )
     elif reason == "first_result":
-        line.append(f" [{reason}]", style="yellow")
+        line.append(f" [{reason}]", style=_STYLE_YELLOW)
 
     console.print(line)
 
@@ -314,7 +431,7 @@ def print_browser_track_added(
             diff_ms = alt.duration_ms - song.duration_ms
             diff_str = format_duration_diff(diff_ms)
             alt_strs.append(f'"{alt.album}" [{diff_str}]')
-        console.print(f"     Other options: {', '.join(alt_strs)}", style="dim")
+        console.print(f"     Other options: {', '.join(alt_strs)}", style=_STYLE_DIM)
 
 
 def print_browser_track_skipped(index: int, song: Song, error: str) -> None:
@@ -325,11 +442,12 @@ def print_browser_track_skipped(index: int, song: Song, error: str) -> None:
         song: The song that was skipped.
         error: The reason for skipping (e.g., "no results").
     """
+    console = _get_console()
     line = Text()
     line.append(f"  {index:2d}. ")
-    line.append("[red]x[/red] ", style="red")
+    line.append("[red]x[/red] ", style=_STYLE_RED)
     line.append(f"{song.title} - {song.artist}")
-    line.append(f" [skipped: {error}]", style="red")
+    line.append(f" [skipped: {error}]", style=_STYLE_RED)
     console.print(line)
 
 
@@ -341,9 +459,10 @@ def print_browser_summary(added: int, skipped: int, playlist_url: str) -> None:
         skipped: Number of tracks skipped.
         playlist_url: URL of the created playlist.
     """
+    console = _get_console()
     total = added + skipped
     console.print()
-    console.print("Summary:", style="bold")
+    console.print("Summary:", style=_STYLE_BOLD)
     console.print(f"  Added: {added}/{total}")
     console.print(f"  Skipped: {skipped}")
     console.print(f"  Playlist: {playlist_url}")
@@ -1,6 +1,8 @@
 """Spotify API client for playlist creation and track search."""
 
+import itertools
 import os
+import threading
 from typing import Any
 
 import spotipy
@@ -19,12 +21,27 @@ SPOTIFY_ENV_VARS = (
 SPOTIFY_ADD_TRACKS_LIMIT = 100
 
 
+def _missing_env_vars() -> tuple[str, ...]:
+    """Find the required Spotify environment variables that are not set.
+
+    Returns:
+        Names of the unset (or empty) variables, in SPOTIFY_ENV_VARS order.
+    """
+    return tuple(var for var in SPOTIFY_ENV_VARS if not os.environ.get(var))
+
+
 class SpotifyNotConfiguredError(Exception):
     """Raised when Spotify credentials are not configured."""
 
-    def __init__(self) -> None:
-        """Initialize with helpful message."""
-        missing = [var for var in SPOTIFY_ENV_VARS if not os.environ.get(var)]
+    def __init__(self, missing: tuple[str, ...] | None = None) -> None:
+        """Initialize with helpful message.
+
+        Args:
+            missing: Names of the unset environment variables. Read from the
+                environment when not given.
+        """
+        if missing is None:
+            missing = _missing_env_vars()
         msg = (
             "Spotify API credentials not configured. "
             f"Missing environment variables: {', '.join(missing)}"
@@ -41,6 +58,14 @@ class SpotifyClient:
         The client is lazy-initialized on first API call.
         """
         self._client: spotipy.Spotify | None = None
+        # Credentials are read from the environment once; they don't change
+        # mid-run
+        self._missing_vars: tuple[str, ...] | None = None
+        # Searches for the same song overlap heavily; parse each id only once
+        self._track_cache: dict[str, SpotifyTrack] = {}
+        self._user_id: str | None = None
+        # Searches run on a thread pool; only one of them may build the client
+        self._client_lock = threading.Lock()
 
     @property
     def is_configured(self) -> bool:
@@ -49,7 +74,17 @@ class SpotifyClient:
         Returns:
             True if all required environment variables are set.
         """
-        return all(os.environ.get(var) for var in SPOTIFY_ENV_VARS)
+        return not self._get_missing_vars()
+
+    def _get_missing_vars(self) -> tuple[str, ...]:
+        """Get the unset Spotify environment variables, checked only once.
+
+        Returns:
+            Names of the unset variables; empty when fully configured.
+        """
+        if self._missing_vars is None:
+            self._missing_vars = _missing_env_vars()
+        return self._missing_vars
 
     def _get_client(self) -> spotipy.Spotify:
         """Get or create the authenticated Spotify client.
@@ -60,31 +95,67 @@ class SpotifyClient:
         Raises:
             SpotifyNotConfiguredError: If credentials are not configured.
         """
-        if not self.is_configured:
-            raise SpotifyNotConfiguredError()
+        if self._client is not None:
+            return self._client
+
+        missing = self._get_missing_vars()
+        if missing:
+            raise SpotifyNotConfiguredError(missing)
 
-        if self._client is None:
-            auth_manager = SpotifyOAuth(
-                scope="playlist-modify-public playlist-modify-private"
-            )
-            self._client = spotipy.Spotify(auth_manager=auth_manager)
+        with self._client_lock:
+            if self._client is None:
+                auth_manager = SpotifyOAuth(
+                    scope="playlist-modify-public playlist-modify-private"
+                )
+                self._client = spotipy.Spotify(auth_manager=auth_manager)
 
         return self._client
 
+    def prepare(self) -> None:
+        """Build the client and refresh a cached access token ahead of use.
+
+        Lets token refresh overlap other work instead of delaying the first
+        search. Never prompts for login: with no usable cached token, the
+        first API call still does that. Does nothing when not configured.
+        """
+        if not self.is_configured:
+            return
+
+        auth_manager = self._get_client().auth_manager
+        auth_manager.validate_token(auth_manager.cache_handler.get_cached_token())
+
+    def authorize(self) -> None:
+        """Get an access token, prompting for login if none is cached.
+
+        Call this before searching from several threads: each thread's
+        first request would otherwise start its own login flow.
+
+        Raises:
+            SpotifyNotConfiguredError: If credentials are not configured.
+        """
+        self._get_client().auth_manager.get_access_token(as_dict=False)
+
     def _parse_track(self, track_data: dict[str, Any]) -> SpotifyTrack:
         """Parse Spotify API track data into SpotifyTrack.
 
+        Repeated ids return the instance parsed first.
+
         Args:
             track_data: Raw track data from Spotify API.
 
         Returns:
             Parsed SpotifyTrack.
         """
+        track_id = track_data["id"]
+        cached = self._track_cache.get(track_id)
+        if cached is not None:
+            return cached
+
         artists = track_data.get("artists", [])
         artist_name = artists[0]["name"] if artists else ""
 
-        return SpotifyTrack(
-            id=track_data["id"],
+        track = SpotifyTrack(
+            id=track_id,
             uri=track_data["uri"],
             title=track_data["name"],
             artist=artist_name,
@@ -92,6 +163,8 @@ class SpotifyClient:
             duration_ms=track_data.get("duration_ms", 0),
             popularity=track_data.get("popularity", 0),
         )
+        self._track_cache[track_id] = track
+        return track
 
     def search_track(
         self,
@@ -117,10 +190,9 @@ class SpotifyClient:
         client = self._get_client()
 
         # Build query with exact matching
-        query_parts = [f'track:"{title}"', f'artist:"{artist}"']
-        if album:
-            query_parts.append(f'album:"{album}"')
-        query = " ".join(query_parts)
+        query = f'track:"{title}" artist:"{artist}"' + (
+            f' album:"{album}"' if album else ""
+        )
 
         results = client.search(q=query, type="track", limit=1)
         tracks = results.get("tracks", {}).get("items", [])
@@ -201,10 +273,11 @@ class SpotifyClient:
             SpotifyNotConfiguredError: If credentials are not configured.
         """
         client = self._get_client()
-        user_id = client.current_user()["id"]
+        if self._user_id is None:
+            self._user_id = client.current_user()["id"]
 
         result = client.user_playlist_create(
-            user=user_id,
+            user=self._user_id,
             name=name,
             public=public,
             description=description,
@@ -235,8 +308,8 @@ class SpotifyClient:
         total_added = 0
 
         # Batch tracks in groups of 100
-        for i in range(0, len(track_uris), SPOTIFY_ADD_TRACKS_LIMIT):
-            batch = track_uris[i : i + SPOTIFY_ADD_TRACKS_LIMIT]
+        uris = iter(track_uris)
+        while batch := list(itertools.islice(uris, SPOTIFY_ADD_TRACKS_LIMIT)):
             client.playlist_add_items(playlist_id, batch)
             total_added += len(batch)
 
@@ -1,27 +1,41 @@
 """Tests for the caching layer."""
 
+import functools
 import json
+import os
+import sqlite3
 import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 from kutx2spotify.cache import (
     DEFAULT_KUTX_TTL_HOURS,
+    SONG_ROWS_VERSION,
     KUTXCache,
     Resolution,
     ResolutionCache,
+    _atomic_write_bytes,
     _dict_to_song,
     _get_cache_dir,
     _make_resolution_key,
-    _song_to_dict,
+    _read_songs,
+    _row_to_song,
+    _song_to_row,
 )
 from kutx2spotify.models import Song
 
 
+@pytest.fixture(autouse=True)
+def clear_song_cache() -> None:
+    """Reset the parsed playlist memo between tests."""
+    _read_songs.cache_clear()
+
+
 @pytest.fixture
 def temp_cache_dir() -> Path:
     """Create a temporary directory for cache tests."""
@@ -65,18 +79,32 @@ def sample_songs() -> list[Song]:
 class TestSongSerialization:
     """Tests for song serialization helpers."""
 
-    def test_song_to_dict(self, sample_song: Song) -> None:
-        """Test converting a Song to a dict."""
-        result = _song_to_dict(sample_song)
+    def test_song_to_row(self, sample_song: Song) -> None:
+        """Test converting a Song to a positional row."""
+        result = _song_to_row(sample_song)
+
+        assert result == [
+            "We Can Work It Out",
+            "Stevie Wonder",
+            "The Complete Motown Singles",
+            180000,
+            1705329000,
+        ]
 
-        assert result["title"] == "We Can Work It Out"
-        assert result["artist"] == "Stevie Wonder"
-        assert result["album"] == "The Complete Motown Singles"
-        assert result["duration_ms"] == 180000
-        assert result["played_at"] == "2024-01-15T14:30:00"
+    def test_row_to_song(self) -> None:
+        """Test converting a positional row back to a Song."""
+        row = ["Test Song", "Test Artist", "Test Album", 240000, 1705320000]
+
+        result = _row_to_song(row)
+
+        assert result.title == "Test Song"
+        assert result.artist == "Test Artist"
+        assert result.album == "Test Album"
+        assert result.duration_ms == 240000
+        assert result.played_at == datetime(2024, 1, 15, 12, 0, 0)
 
     def test_dict_to_song(self) -> None:
-        """Test converting a dict back to a Song."""
+        """Test converting a legacy dict back to a Song."""
         data = {
             "title": "Test Song",
             "artist": "Test Artist",
@@ -93,10 +121,30 @@ class TestSongSerialization:
         assert result.duration_ms == 240000
         assert result.played_at == datetime(2024, 1, 15, 12, 0, 0)
 
+    def test_row_with_iso_played_at(self) -> None:
+        """Test that rows with an ISO timestamp string still decode."""
+        row = ["Test Song", "Test Artist", "Test Album", 240000, "2024-01-15T12:00:00"]
+
+        result = _row_to_song(row)
+
+        assert result.played_at == datetime(2024, 1, 15, 12, 0, 0)
+
+    def test_played_at_ignores_local_timezone(self, sample_song: Song) -> None:
+        """Test that the encoded play time does not depend on the local zone."""
+        try:
+            with patch.dict(os.environ, {"TZ": "America/Chicago"}):
+                time.tzset()
+                row = _song_to_row(sample_song)
+        finally:
+            time.tzset()
+
+        assert row[4] == 1705329000
+        assert _row_to_song(row) == sample_song
+
     def test_roundtrip(self, sample_song: Song) -> None:
         """Test that song survives serialization roundtrip."""
-        data = _song_to_dict(sample_song)
-        result = _dict_to_song(data)
+        row = _song_to_row(sample_song)
+        result = _row_to_song(row)
         assert result == sample_song
 
 
@@ -111,6 +159,44 @@ class TestGetCacheDir:
             assert result.is_dir()
 
 
+class TestAtomicWriteBytes:
+    """Tests for _atomic_write_bytes function."""
+
+    def test_writes_without_leftover_temp(self, temp_cache_dir: Path) -> None:
+        """Test that the data lands in place and the temp file is gone."""
+        path = temp_cache_dir / "data.json"
+
+        _atomic_write_bytes(path, b"[]")
+
+        assert path.read_bytes() == b"[]"
+        assert list(temp_cache_dir.iterdir()) == [path]
+
+    def test_failed_write_keeps_old_file(self, temp_cache_dir: Path) -> None:
+        """Test that a write interrupted before the rename keeps the old data."""
+        path = temp_cache_dir / "data.json"
+        path.write_bytes(b"[1]")
+
+        with (
+            patch("kutx2spotify.cache.os.replace", side_effect=OSError),
+            pytest.raises(OSError),
+        ):
+            _atomic_write_bytes(path, b"[2]")
+
+        assert path.read_bytes() == b"[1]"
+        assert list(temp_cache_dir.iterdir()) == [path]
+
+    def test_temp_file_is_unique(self, temp_cache_dir: Path) -> None:
+        """Test that a stale temp file from another writer is left alone."""
+        path = temp_cache_dir / "data.json"
+        stale = temp_cache_dir / "data.json.tmp"
+        stale.write_bytes(b"[0]")
+
+        _atomic_write_bytes(path, b"[1]")
+
+        assert path.read_bytes() == b"[1]"
+        assert stale.read_bytes() == b"[0]"
+
+
 class TestKUTXCache:
     """Tests for KUTXCache class."""
 
@@ -154,6 +240,58 @@ class TestKUTXCache:
         assert result[0].title == "Song One"
         assert result[1].title == "Song Two"
 
+    def test_set_writes_stdlib_readable_json(
+        self, temp_cache_dir: Path, sample_songs: list[Song]
+    ) -> None:
+        """Test that cached files can be read back with the stdlib parser."""
+        cache = KUTXCache(cache_dir=temp_cache_dir)
+        date = datetime(2024, 1, 15)
+
+        cache.set(date, sample_songs)
+        data = json.loads((temp_cache_dir / "2024-01-15.json").read_text())
+
+        assert data == {
+            "v": SONG_ROWS_VERSION,
+            "songs": [_song_to_row(s) for s in sample_songs],
+        }
+
+    def test_get_legacy_dict_format(
+        self, temp_cache_dir: Path, sample_songs: list[Song]
+    ) -> None:
+        """Test that files in the old list-of-dicts format still load."""
+        cache = KUTXCache(cache_dir=temp_cache_dir)
+        date = datetime(2024, 1, 15)
+        legacy = [
+            {
+                "title": s.title,
+                "artist": s.artist,
+                "album": s.album,
+                "duration_ms": s.duration_ms,
+                "played_at": s.played_at.isoformat(),
+            }
+            for s in sample_songs
+        ]
+        cache._cache_path(date).write_text(json.dumps(legacy))
+
+        assert cache.get(date) == sample_songs
+
+    def test_get_unknown_version(self, temp_cache_dir: Path) -> None:
+        """Test that a file with an unknown format version is a miss."""
+        cache = KUTXCache(cache_dir=temp_cache_dir)
+        date = datetime(2024, 1, 15)
+        cache._cache_path(date).write_text(json.dumps({"v": 99, "songs": []}))
+
+        assert cache.get(date) is None
+
+    def test_get_malformed_row(self, temp_cache_dir: Path) -> None:
+        """Test that a row with the wrong shape is a miss."""
+        cache = KUTXCache(cache_dir=temp_cache_dir)
+        date = datetime(2024, 1, 15)
+        data = {"v": SONG_ROWS_VERSION, "songs": [["Only", "Three", "Fields"]]}
+        cache._cache_path(date).write_text(json.dumps(data))
+
+        assert cache.get(date) is None
+
     def test_cache_path_format(self, temp_cache_dir: Path) -> None:
         """Test cache file path format."""
         cache = KUTXCache(cache_dir=temp_cache_dir)
@@ -173,8 +311,6 @@ class TestKUTXCache:
         # Mock file modification time to be old
         path = cache._cache_path(date)
         old_time = time.time() - (2 * 3600)  # 2 hours ago
-        import os
-
         os.utime(path, (old_time, old_time))
 
         result = cache.get(date)
@@ -193,6 +329,73 @@ class TestKUTXCache:
         assert result is not None
         assert len(result) == 2
 
+    def test_get_hit_stats_once(
+        self, temp_cache_dir: Path, sample_songs: list[Song]
+    ) -> None:
+        """Test that a cache hit costs a single stat() call."""
+        cache = KUTXCache(cache_dir=temp_cache_dir)
+        date = datetime(2024, 1, 15)
+        cache.set(date, sample_songs)
+
+        with patch("kutx2spotify.cache.os.stat", wraps=os.stat) as mock_stat:
+            result = cache.get(date)
+
+        assert result is not None
+        mock_stat.assert_called_once_with(cache._cache_path(date))
+
+    def test_get_file_removed_after_stat(
+        self, temp_cache_dir: Path, sample_songs: list[Song]
+    ) -> None:
+        """Test that a file deleted between stat() and read is a miss."""
+        cache = KUTXCache(cache_dir=temp_cache_dir)
+        date = datetime(2024, 1, 15)
+        cache.set(date, sample_songs)
+
+        with patch.object(Path, "read_bytes", side_effect=FileNotFoundError):
+            result = cache.get(date)
+
+        assert result is None
+
+    def test_get_parses_file_once(
+        self, temp_cache_dir: Path, sample_songs: list[Song]
+    ) -> None:
+        """Test that repeat lookups reuse the parsed playlist."""
+        cache = KUTXCache(cache_dir=temp_cache_dir)
+        date = datetime(2024, 1, 15)
+        cache.set(date, sample_songs)
+
+        with patch("kutx2spotify.cache.orjson.loads", wraps=orjson.loads) as mock_loads:
+            first = cache.get(date)
+            second = cache.get(date)
+
+        assert first == second == sample_songs
+        assert first is not second
+        mock_loads.assert_called_once()
+
+    def test_get_returns_play_order(
+        self, temp_cache_dir: Path, sample_songs: list[Song]
+    ) -> None:
+        """Test that cached songs come back sorted by play time."""
+        cache = KUTXCache(cache_dir=temp_cache_dir)
+        date = datetime(2024, 1, 15)
+
+        cache.set(date, list(reversed(sample_songs)))
+
+        assert cache.get(date) == sample_songs
+
+    def test_get_rereads_after_set(
+        self, temp_cache_dir: Path, sample_songs: list[Song]
+    ) -> None:
+        """Test that rewriting a date invalidates the parsed playlist."""
+        cache = KUTXCache(cache_dir=temp_cache_dir)
+        date = datetime(2024, 1, 15)
+        cache.set(date, sample_songs)
+        assert cache.get(date) == sample_songs
+
+        cache.set(date, sample_songs[:1])
+
+        assert cache.get(date) == sample_songs[:1]
+
     def test_get_invalid_json(self, temp_cache_dir: Path) -> None:
         """Test that invalid JSON returns None."""
         cache = KUTXCache(cache_dir=temp_cache_dir)
@@ -257,6 +460,87 @@ class TestKUTXCache:
         for date in dates:
             assert cache.get(date) is None
 
+    def test_clear_all_skips_other_entries(
+        self, temp_cache_dir: Path, sample_songs: list[Song]
+    ) -> None:
+        """Test that only JSON cache files are deleted."""
+        cache = KUTXCache(cache_dir=temp_cache_dir)
+        cache.set(datetime(2024, 1, 15), sample_songs)
+        (temp_cache_dir / "notes.txt").write_text("keep")
+        (temp_cache_dir / "nested.json").mkdir()
+
+        count = cache.clear_all()
+
+        assert count == 1
+        assert sorted(p.name for p in temp_cache_dir.iterdir()) == [
+            "nested.json",
+            "notes.txt",
+        ]
+
+    def test_clear_expired(
+        self, temp_cache_dir: Path, sample_songs: list[Song]
+    ) -> None:
+        """Test that only files older than the TTL are deleted."""
+        cache = KUTXCache(cache_dir=temp_cache_dir, ttl_hours=1)
+        old = datetime(2024, 1, 15)
+        fresh = datetime(2024, 1, 16)
+        cache.set(old, sample_songs)
+        cache.set(fresh, sample_songs)
+        old_time = time.time() - (2 * 3600)
+        os.utime(cache._cache_path(old), (old_time, old_time))
+        (temp_cache_dir / "notes.txt").write_text("keep")
+
+        count = cache.clear_expired()
+
+        assert count == 1
+        assert not cache._cache_path(old).exists()
+        assert cache.get(fresh) == sample_songs
+        assert (temp_cache_dir / "notes.txt").exists()
+
+    def test_clear_skips_files_already_removed(
+        self, temp_cache_dir: Path, sample_songs: list[Song]
+    ) -> None:
+        """Test that files another process deletes first are not counted."""
+        cache = KUTXCache(cache_dir=temp_cache_dir, ttl_hours=1)
+        date = datetime(2024, 1, 15)
+        cache.set(date, sample_songs)
+        old_time = time.time() - (2 * 3600)
+        os.utime(cache._cache_path(date), (old_time, old_time))
+
+        with patch("kutx2spotify.cache.os.unlink", side_effect=FileNotFoundError):
+            assert cache.clear_expired() == 0
+            assert cache.clear_all() == 0
+
+    def test_scan_expiry_skips_files_already_removed(
+        self, temp_cache_dir: Path, sample_songs: list[Song]
+    ) -> None:
+        """Test that a file deleted mid-scan is skipped."""
+        cache = KUTXCache(cache_dir=temp_cache_dir)
+        cache.set(datetime(2024, 1, 15), sample_songs)
+
+        with patch("kutx2spotify.cache.os.scandir") as mock_scandir:
+            entry = MagicMock()
+            entry.name = "2024-01-15.json"
+            entry.stat.side_effect = FileNotFoundError
+            mock_scandir.return_value.__enter__.return_value = [entry]
+
+            assert list(cache._scan_expiry()) == []
+
+    def test_scan_expiry_reads_clock_once(
+        self, temp_cache_dir: Path, sample_songs: list[Song]
+    ) -> None:
+        """Test that a batch expiry check samples the time once."""
+        cache = KUTXCache(cache_dir=temp_cache_dir)
+        for day in range(1, 6):
+            cache.set(datetime(2024, 1, day), sample_songs)
+
+        with patch("kutx2spotify.cache.time.time", wraps=time.time) as mock_time:
+            results = list(cache._scan_expiry())
+
+        assert len(results) == 5
+        assert not any(expired for _, expired in results)
+        mock_time.assert_called_once()
+
     def test_clear_all_empty(self, temp_cache_dir: Path) -> None:
         """Test clearing empty cache."""
         cache = KUTXCache(cache_dir=temp_cache_dir)
@@ -288,6 +572,15 @@ class TestResolution:
 
         assert resolution.note == ""
 
+    def test_uses_slots(self) -> None:
+        """Test that resolutions carry no per-instance dict."""
+        resolution = Resolution(
+            spotify_uri="spotify:track:yyy",
+            resolved_album="Some Album",
+        )
+
+        assert not hasattr(resolution, "__dict__")
+
 
 class TestMakeResolutionKey:
     """Tests for _make_resolution_key helper."""
@@ -320,20 +613,20 @@ class TestResolutionCache:
 
     def test_init_with_path(self, temp_cache_dir: Path) -> None:
         """Test initialization with explicit path."""
-        path = temp_cache_dir / "resolutions.json"
+        path = temp_cache_dir / "resolutions.db"
         cache = ResolutionCache(cache_path=path)
 
         assert cache.cache_path == path
 
     def test_has_miss(self, temp_cache_dir: Path, sample_song: Song) -> None:
         """Test has() returns False for missing song."""
-        cache = ResolutionCache(cache_path=temp_cache_dir / "res.json")
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
 
         assert cache.has(sample_song) is False
 
     def test_get_miss(self, temp_cache_dir: Path, sample_song: Song) -> None:
         """Test get() returns None for missing song."""
-        cache = ResolutionCache(cache_path=temp_cache_dir / "res.json")
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
 
         result = cache.get(sample_song)
 
@@ -341,7 +634,7 @@ class TestResolutionCache:
 
     def test_set_and_get(self, temp_cache_dir: Path, sample_song: Song) -> None:
         """Test setting and getting a resolution."""
-        cache = ResolutionCache(cache_path=temp_cache_dir / "res.json")
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
         resolution = Resolution(
             spotify_uri="spotify:track:abc123",
             resolved_album="Signed, Sealed & Delivered",
@@ -358,7 +651,7 @@ class TestResolutionCache:
 
     def test_set_and_has(self, temp_cache_dir: Path, sample_song: Song) -> None:
         """Test has() returns True after setting."""
-        cache = ResolutionCache(cache_path=temp_cache_dir / "res.json")
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
         resolution = Resolution(
             spotify_uri="spotify:track:xyz",
             resolved_album="Album",
@@ -370,7 +663,7 @@ class TestResolutionCache:
 
     def test_case_insensitive(self, temp_cache_dir: Path) -> None:
         """Test that lookups are case-insensitive."""
-        cache = ResolutionCache(cache_path=temp_cache_dir / "res.json")
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
         resolution = Resolution(
             spotify_uri="spotify:track:123",
             resolved_album="Album",
@@ -400,15 +693,15 @@ class TestResolutionCache:
 
     def test_persistence(self, temp_cache_dir: Path, sample_song: Song) -> None:
         """Test that resolutions persist across cache instances."""
-        path = temp_cache_dir / "res.json"
+        path = temp_cache_dir / "res.db"
         resolution = Resolution(
             spotify_uri="spotify:track:persist",
             resolved_album="Persisted Album",
         )
 
         # Set with first instance
-        cache1 = ResolutionCache(cache_path=path)
-        cache1.set(sample_song, resolution)
+        with ResolutionCache(cache_path=path) as cache1:
+            cache1.set(sample_song, resolution)
 
         # Get with second instance
         cache2 = ResolutionCache(cache_path=path)
@@ -419,7 +712,7 @@ class TestResolutionCache:
 
     def test_remove_existing(self, temp_cache_dir: Path, sample_song: Song) -> None:
         """Test removing an existing resolution."""
-        cache = ResolutionCache(cache_path=temp_cache_dir / "res.json")
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
         resolution = Resolution(
             spotify_uri="spotify:track:remove",
             resolved_album="Album",
@@ -433,7 +726,7 @@ class TestResolutionCache:
 
     def test_remove_nonexistent(self, temp_cache_dir: Path, sample_song: Song) -> None:
         """Test removing a non-existent resolution."""
-        cache = ResolutionCache(cache_path=temp_cache_dir / "res.json")
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
 
         result = cache.remove(sample_song)
 
@@ -441,7 +734,7 @@ class TestResolutionCache:
 
     def test_clear(self, temp_cache_dir: Path) -> None:
         """Test clearing all resolutions."""
-        cache = ResolutionCache(cache_path=temp_cache_dir / "res.json")
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
         songs = [
             Song(
                 title=f"Song {i}",
@@ -467,7 +760,7 @@ class TestResolutionCache:
 
     def test_count(self, temp_cache_dir: Path) -> None:
         """Test counting resolutions."""
-        cache = ResolutionCache(cache_path=temp_cache_dir / "res.json")
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
 
         assert cache.count() == 0
 
@@ -486,29 +779,169 @@ class TestResolutionCache:
 
         assert cache.count() == 5
 
-    def test_load_invalid_json(self, temp_cache_dir: Path) -> None:
-        """Test loading invalid JSON file."""
-        path = temp_cache_dir / "res.json"
-        path.write_text("not valid json")
+    def test_opens_database_lazily(self, temp_cache_dir: Path) -> None:
+        """Test that constructing the cache does not touch the disk."""
+        path = temp_cache_dir / "res.db"
 
         cache = ResolutionCache(cache_path=path)
+        assert not path.exists()
 
         assert cache.count() == 0
+        assert path.exists()
+        cache.close()
+
+    def test_uses_wal_journal(self, temp_cache_dir: Path) -> None:
+        """Test that the database is opened in WAL mode."""
+        path = temp_cache_dir / "res.db"
+        with ResolutionCache(cache_path=path) as cache:
+            cache.count()
+
+        conn = sqlite3.connect(path)
+        try:
+            (mode,) = conn.execute("PRAGMA journal_mode").fetchone()
+        finally:
+            conn.close()
+        assert mode == "wal"
+
+    def test_set_is_invisible_until_flush(
+        self, temp_cache_dir: Path, sample_song: Song
+    ) -> None:
+        """Test that other readers only see changes after flush()."""
+        path = temp_cache_dir / "res.db"
+        cache = ResolutionCache(cache_path=path)
+
+        cache.set(
+            sample_song,
+            Resolution(spotify_uri="spotify:track:abc", resolved_album="Album"),
+        )
+        with ResolutionCache(cache_path=path) as reader:
+            assert not reader.has(sample_song)
+
+        cache.flush()
+        with ResolutionCache(cache_path=path) as reader:
+            assert reader.has(sample_song)
+        cache.close()
+
+    def test_flush_and_close_before_use(self, temp_cache_dir: Path) -> None:
+        """Test that flush() and close() are no-ops before the first query."""
+        path = temp_cache_dir / "res.db"
+        cache = ResolutionCache(cache_path=path)
+
+        cache.flush()
+        cache.close()
+
+        assert not path.exists()
+
+    def test_many_sets_commit_once(self, temp_cache_dir: Path) -> None:
+        """Test that a batch of changes is committed in a single transaction."""
+        path = temp_cache_dir / "res.db"
+
+        with ResolutionCache(cache_path=path) as cache:
+            cache.count()
+            with patch.object(cache, "_conn", wraps=cache._conn) as mock_conn:
+                for i in range(10):
+                    song = Song(
+                        title=f"Song {i}",
+                        artist="Artist",
+                        album="Album",
+                        duration_ms=100,
+                        played_at=datetime.now(),
+                    )
+                    cache.set(
+                        song,
+                        Resolution(
+                            spotify_uri=f"spotify:track:{i}", resolved_album="A"
+                        ),
+                    )
+                cache.flush()
+
+            mock_conn.commit.assert_called_once()
+
+        with ResolutionCache(cache_path=path) as cache:
+            assert cache.count() == 10
+
+    def test_remove_and_clear_are_flushed(
+        self, temp_cache_dir: Path, sample_song: Song
+    ) -> None:
+        """Test that remove() and clear() changes reach the disk on exit."""
+        path = temp_cache_dir / "res.db"
+        with ResolutionCache(cache_path=path) as cache:
+            cache.set(
+                sample_song,
+                Resolution(spotify_uri="spotify:track:abc", resolved_album="Album"),
+            )
+
+        with ResolutionCache(cache_path=path) as cache:
+            assert cache.remove(sample_song) is True
+        with ResolutionCache(cache_path=path) as cache:
+            assert cache.count() == 0
+
+        with ResolutionCache(cache_path=path) as cache:
+            cache.set(
+                sample_song,
+                Resolution(spotify_uri="spotify:track:abc", resolved_album="Album"),
+            )
+        with ResolutionCache(cache_path=path) as cache:
+            assert cache.clear() == 1
+        with ResolutionCache(cache_path=path) as cache:
+            assert cache.count() == 0
+
+    def test_load_invalid_database(self, temp_cache_dir: Path) -> None:
+        """Test that a file that is not a database is replaced."""
+        path = temp_cache_dir / "res.db"
+        path.write_text("not a sqlite database" * 100)
+
+        with ResolutionCache(cache_path=path) as cache:
+            assert cache.count() == 0
+
+    def test_locked_database_is_kept(
+        self,
+        temp_cache_dir: Path,
+        sample_song: Song,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a database locked by another process is not replaced."""
+        path = temp_cache_dir / "res.db"
+        with ResolutionCache(cache_path=path) as cache:
+            cache.set(
+                sample_song,
+                Resolution(spotify_uri="spotify:track:abc", resolved_album="Album"),
+            )
 
-    def test_get_with_missing_note(self, temp_cache_dir: Path) -> None:
-        """Test getting a resolution that has no note field."""
-        path = temp_cache_dir / "res.json"
-        # Write data without 'note' field
+        lock = sqlite3.connect(path, isolation_level=None)
+        lock.execute("PRAGMA journal_mode=DELETE")
+        lock.execute("BEGIN EXCLUSIVE")
+        # Fail at once instead of waiting out the default busy timeout
+        monkeypatch.setattr(
+            sqlite3, "connect", functools.partial(sqlite3.connect, timeout=0)
+        )
+        try:
+            with (
+                pytest.raises(sqlite3.OperationalError, match="locked"),
+                ResolutionCache(cache_path=path) as cache,
+            ):
+                cache.count()
+        finally:
+            lock.close()
+
+        with ResolutionCache(cache_path=path) as cache:
+            assert cache.count() == 1
+
+    def test_imports_legacy_json(self, temp_cache_dir: Path) -> None:
+        """Test that a resolutions.json beside a new database is imported."""
         data = {
             "song|artist|album": {
                 "spotify_uri": "spotify:track:xyz",
                 "resolved_album": "Album",
-            }
+                "note": "picked by hand",
+            },
+            # Written without a 'note' field
+            "other|artist|album": {
+                "spotify_uri": "spotify:track:abc",
+                "resolved_album": "Other Album",
+            },
         }
-        with path.open("w") as f:
-            json.dump(data, f)
-
-        cache = ResolutionCache(cache_path=path)
+        (temp_cache_dir / "res.json").write_text(json.dumps(data))
         song = Song(
             title="Song",
             artist="Artist",
@@ -516,15 +949,153 @@ class TestResolutionCache:
             duration_ms=100,
             played_at=datetime.now(),
         )
+        other = Song(
+            title="Other",
+            artist="Artist",
+            album="Album",
+            duration_ms=100,
+            played_at=datetime.now(),
+        )
 
-        result = cache.get(song)
+        with ResolutionCache(cache_path=temp_cache_dir / "res.db") as cache:
+            result = cache.get(song)
+            other_result = cache.get(other)
+            assert cache.count() == 2
 
         assert result is not None
-        assert result.note == ""
+        assert result.note == "picked by hand"
+        assert other_result is not None
+        assert other_result.note == ""
+
+    def test_legacy_json_imported_once(
+        self, temp_cache_dir: Path, sample_song: Song
+    ) -> None:
+        """Test that the legacy file does not resurrect removed entries."""
+        data = {
+            _make_resolution_key(sample_song): {
+                "spotify_uri": "spotify:track:xyz",
+                "resolved_album": "Album",
+            }
+        }
+        (temp_cache_dir / "res.json").write_text(json.dumps(data))
+        path = temp_cache_dir / "res.db"
+
+        with ResolutionCache(cache_path=path) as cache:
+            assert cache.remove(sample_song) is True
+        with ResolutionCache(cache_path=path) as cache:
+            assert cache.has(sample_song) is False
+
+    def test_rekeys_older_database(self, temp_cache_dir: Path) -> None:
+        """Test that keys from an older schema version are normalized."""
+        path = temp_cache_dir / "res.db"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE resolutions (key TEXT PRIMARY KEY, "
+            "spotify_uri TEXT NOT NULL, resolved_album TEXT NOT NULL, "
+            "note TEXT NOT NULL DEFAULT '')"
+        )
+        conn.executemany(
+            "INSERT INTO resolutions VALUES (?, ?, ?, ?)",
+            [
+                ("straße  song|artist|album", "spotify:track:a", "Album", ""),
+                ("plain|artist|album", "spotify:track:b", "Album", ""),
+                ("no separators", "spotify:track:c", "Album", ""),
+            ],
+        )
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+        conn.close()
+        song = Song(
+            title="Strasse Song",
+            artist="Artist",
+            album="Album",
+            duration_ms=100,
+            played_at=datetime.now(),
+        )
+
+        with ResolutionCache(cache_path=path) as cache:
+            result = cache.get(song)
+            assert cache.count() == 3
+
+        assert result is not None
+        assert result.spotify_uri == "spotify:track:a"
+
+    def test_invalid_legacy_json_ignored(self, temp_cache_dir: Path) -> None:
+        """Test that an unreadable legacy file does not block startup."""
+        (temp_cache_dir / "res.json").write_text("not valid json")
+
+        with ResolutionCache(cache_path=temp_cache_dir / "res.db") as cache:
+            assert cache.count() == 0
+
+    def test_malformed_legacy_json_ignored(self, temp_cache_dir: Path) -> None:
+        """Test that legacy entries with the wrong shape are skipped."""
+        (temp_cache_dir / "res.json").write_text(json.dumps({"key": "value"}))
+
+        with ResolutionCache(cache_path=temp_cache_dir / "res.db") as cache:
+            assert cache.count() == 0
+
+    def test_json_cache_path_has_no_legacy_import(self, temp_cache_dir: Path) -> None:
+        """Test that a database named *.json does not import itself."""
+        with ResolutionCache(cache_path=temp_cache_dir / "res.json") as cache:
+            assert cache.count() == 0
+
+    def test_get_reuses_decoded_resolution(
+        self, temp_cache_dir: Path, sample_song: Song
+    ) -> None:
+        """Test that repeat lookups skip the database."""
+        path = temp_cache_dir / "res.db"
+        with ResolutionCache(cache_path=path) as writer:
+            writer.set(
+                sample_song,
+                Resolution(spotify_uri="spotify:track:abc", resolved_album="Album"),
+            )
+
+        with ResolutionCache(cache_path=path) as cache:
+            first = cache.get(sample_song)
+            with patch.object(cache, "_db") as mock_db:
+                assert cache.get(sample_song) is first
+                assert cache.has(sample_song)
+            mock_db.assert_not_called()
+
+    def test_remembers_unresolved_songs(
+        self, temp_cache_dir: Path, sample_song: Song
+    ) -> None:
+        """Test that a song without a resolution is only queried once."""
+        with ResolutionCache(cache_path=temp_cache_dir / "res.db") as cache:
+            assert cache.get(sample_song) is None
+            with patch.object(cache, "_db") as mock_db:
+                assert cache.get(sample_song) is None
+                assert not cache.has(sample_song)
+            mock_db.assert_not_called()
+
+            resolution = Resolution(
+                spotify_uri="spotify:track:abc", resolved_album="Album"
+            )
+            cache.set(sample_song, resolution)
+            assert cache.get(sample_song) == resolution
+
+    def test_remove_forgets_decoded_resolution(
+        self, temp_cache_dir: Path, sample_song: Song
+    ) -> None:
+        """Test that remove() and clear() drop remembered resolutions."""
+        with ResolutionCache(cache_path=temp_cache_dir / "res.db") as cache:
+            resolution = Resolution(
+                spotify_uri="spotify:track:abc", resolved_album="Album"
+            )
+            cache.set(sample_song, resolution)
+            assert cache.get(sample_song) == resolution
+
+            cache.remove(sample_song)
+            assert cache.get(sample_song) is None
+            assert not cache.has(sample_song)
+
+            cache.set(sample_song, resolution)
+            cache.clear()
+            assert cache.get(sample_song) is None
 
     def test_update_existing(self, temp_cache_dir: Path, sample_song: Song) -> None:
         """Test updating an existing resolution."""
-        cache = ResolutionCache(cache_path=temp_cache_dir / "res.json")
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
 
         cache.set(
             sample_song,
@@ -545,3 +1116,76 @@ class TestResolutionCache:
         assert result is not None
         assert result.spotify_uri == "spotify:track:second"
         assert cache.count() == 1
+
+
+class TestResolutionCacheMisses:
+    """Tests for the negative-match records in ResolutionCache."""
+
+    def test_unknown_song_is_not_a_miss(
+        self, temp_cache_dir: Path, sample_song: Song
+    ) -> None:
+        """Test is_miss() is False before a miss is recorded."""
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
+
+        assert cache.is_miss(sample_song) is False
+
+    def test_add_miss(self, temp_cache_dir: Path, sample_song: Song) -> None:
+        """Test a recorded miss is reported and does not count as resolved."""
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
+
+        cache.add_miss(sample_song)
+        cache.add_miss(sample_song)
+
+        assert cache.is_miss(sample_song) is True
+        assert cache.has(sample_song) is False
+        assert cache.count() == 0
+
+    def test_miss_persists(self, temp_cache_dir: Path, sample_song: Song) -> None:
+        """Test misses survive reopening the database."""
+        path = temp_cache_dir / "res.db"
+
+        with ResolutionCache(cache_path=path) as cache:
+            cache.add_miss(sample_song)
+        with ResolutionCache(cache_path=path) as cache:
+            assert cache.is_miss(sample_song) is True
+
+    def test_miss_expires(self, temp_cache_dir: Path, sample_song: Song) -> None:
+        """Test a miss older than the TTL is searched again."""
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db", miss_ttl_days=7)
+        cache.add_miss(sample_song)
+
+        eight_days = time.time() + 8 * 86400
+        with patch("kutx2spotify.cache.time.time", return_value=eight_days):
+            assert cache.is_miss(sample_song) is False
+
+    def test_clear_misses(self, temp_cache_dir: Path, sample_song: Song) -> None:
+        """Test clear_misses() forgets misses but keeps resolutions."""
+        cache = ResolutionCache(cache_path=temp_cache_dir / "res.db")
+        cache.set(
+            sample_song,
+            Resolution(spotify_uri="spotify:track:abc", resolved_album="Album"),
+        )
+        cache.add_miss(sample_song)
+
+        assert cache.clear_misses() == 1
+        assert cache.is_miss(sample_song) is False
+        assert cache.count() == 1
+
+    def test_older_database_gains_misses_table(
+        self, temp_cache_dir: Path, sample_song: Song
+    ) -> None:
+        """Test a database from an earlier schema can record misses."""
+        path = temp_cache_dir / "res.db"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE resolutions (key TEXT PRIMARY KEY, "
+            "spotify_uri TEXT NOT NULL, resolved_album TEXT NOT NULL, "
+            "note TEXT NOT NULL DEFAULT '')"
+        )
+        conn.execute("PRAGMA user_version = 2")
+        conn.commit()
+        conn.close()
+
+        with ResolutionCache(cache_path=path) as cache:
+            cache.add_miss(sample_song)
+            assert cache.is_miss(sample_song) is True
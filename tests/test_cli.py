@@ -1,5 +1,7 @@
 """Tests for CLI module."""
 
+import subprocess
+import sys
 from datetime import datetime, time
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -11,7 +13,9 @@ from kutx2spotify.browser import SearchResult
 from kutx2spotify.cli import (
     DATE,
     TIME,
+    _fetch_songs,
     _run_browser_workflow,
+    _select_tracks,
     main,
     parse_date,
     parse_resolve,
@@ -55,6 +59,23 @@ def make_track(
     )
 
 
+class TestLazyImports:
+    """Tests for deferred client imports."""
+
+    def test_import_skips_heavy_clients(self) -> None:
+        """Test that importing the CLI does not load the clients or console."""
+        code = (
+            "import sys, kutx2spotify.cli; "
+            "heavy = {'httpx', 'playwright', 'spotipy', 'rich.console'}; "
+            "print(*sorted(heavy & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == ""
+
+
 class TestParseDate:
     """Tests for parse_date function."""
 
@@ -73,6 +94,20 @@ class TestParseDate:
         with pytest.raises(click.BadParameter, match="Invalid date format"):
             parse_date("not-a-date")
 
+    def test_out_of_range_date(self) -> None:
+        """Test well-formed but impossible date raises error."""
+        with pytest.raises(click.BadParameter, match="Invalid date format"):
+            parse_date("2024-02-30")
+
+    def test_unpadded_date(self) -> None:
+        """Test dates without zero padding are still accepted."""
+        assert parse_date("2024-1-5") == datetime(2024, 1, 5)
+
+    def test_signed_fields_rejected(self) -> None:
+        """Test that int()-style signs are not accepted in fields."""
+        with pytest.raises(click.BadParameter, match="Invalid date format"):
+            parse_date("2024-+1-15")
+
 
 class TestParseTime:
     """Tests for parse_time function."""
@@ -97,6 +132,15 @@ class TestParseTime:
         with pytest.raises(click.BadParameter, match="Invalid time format"):
             parse_time("not-a-time")
 
+    def test_out_of_range_time(self) -> None:
+        """Test well-formed but impossible time raises error."""
+        with pytest.raises(click.BadParameter, match="Invalid time format"):
+            parse_time("24:00")
+
+    def test_unpadded_time(self) -> None:
+        """Test times without zero padding are still accepted."""
+        assert parse_time("9:05") == time(9, 5)
+
 
 class TestParseResolve:
     """Tests for parse_resolve function."""
@@ -180,9 +224,9 @@ class TestMainCommand:
         )
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
             mock_spotify.return_value.is_configured = False
@@ -193,6 +237,62 @@ class TestMainCommand:
         assert result.exit_code == 0
         assert "Preview mode" in result.output
 
+    def test_spotify_prepared_during_fetch(self) -> None:
+        """Test the Spotify token is readied before matching starts."""
+        runner = CliRunner()
+
+        songs = [make_song()]
+        match_result = MatchResult()
+        match_result.add(Match(song=songs[0], track=None, status=MatchStatus.NOT_FOUND))
+
+        with (
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
+        ):
+            mock_kutx.return_value.fetch_range.return_value = songs
+            mock_spotify.return_value.is_configured = False
+            mock_matcher.return_value.match_songs.return_value = match_result
+
+            result = runner.invoke(main, ["--date", "2024-01-15", "--preview"])
+
+        assert result.exit_code == 0
+        mock_spotify.return_value.prepare.assert_called_once()
+        mock_kutx.return_value.close.assert_called_once()
+
+    def test_kutx_client_closed_when_fetch_fails(self) -> None:
+        """Test the KUTX client is closed even if fetching raises."""
+        runner = CliRunner()
+
+        with (
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient"),
+        ):
+            mock_kutx.return_value.fetch_range.side_effect = RuntimeError("boom")
+
+            result = runner.invoke(main, ["--date", "2024-01-15", "--preview"])
+
+        assert isinstance(result.exception, RuntimeError)
+        mock_kutx.return_value.close.assert_called_once()
+
+    def test_resolution_cache_closed_when_matching_fails(self) -> None:
+        """Test the resolution cache is closed even if matching raises."""
+        runner = CliRunner()
+
+        with (
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient"),
+            patch("kutx2spotify.cli.ResolutionCache") as mock_resolution_cache,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
+        ):
+            mock_kutx.return_value.fetch_range.return_value = [make_song()]
+            mock_matcher.return_value.match_songs.side_effect = RuntimeError("boom")
+
+            result = runner.invoke(main, ["--date", "2024-01-15", "--preview"])
+
+        assert isinstance(result.exception, RuntimeError)
+        mock_resolution_cache.return_value.__exit__.assert_called_once()
+
     def test_manual_mode(self) -> None:
         """Test manual mode shows search links."""
         runner = CliRunner()
@@ -202,9 +302,9 @@ class TestMainCommand:
         match_result.add(Match(song=songs[0], track=None, status=MatchStatus.NOT_FOUND))
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
             mock_spotify.return_value.is_configured = False
@@ -220,8 +320,8 @@ class TestMainCommand:
         runner = CliRunner()
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient"),
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient"),
         ):
             mock_kutx.return_value.fetch_range.return_value = []
 
@@ -241,9 +341,9 @@ class TestMainCommand:
         )
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
             mock_spotify.return_value.is_configured = False
@@ -278,9 +378,9 @@ class TestMainCommand:
         match_result.add(Match(song=songs[1], track=None, status=MatchStatus.NOT_FOUND))
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
             mock_spotify.return_value.is_configured = False
@@ -304,9 +404,9 @@ class TestMainCommand:
         )
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
             mock_spotify.return_value.is_configured = False
@@ -331,10 +431,10 @@ class TestMainCommand:
         )
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
             patch("kutx2spotify.cli.KUTXCache") as mock_cache,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_cache.return_value.get.return_value = songs
             mock_kutx.return_value.fetch_range.return_value = songs
@@ -348,6 +448,7 @@ class TestMainCommand:
 
         assert result.exit_code == 0
         assert "Using cached KUTX data" in result.output
+        mock_cache.return_value.clear_expired.assert_called_once_with()
 
     def test_create_playlist_without_spotify_config(self) -> None:
         """Test creating playlist without Spotify credentials fails."""
@@ -360,9 +461,9 @@ class TestMainCommand:
         )
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
             mock_spotify.return_value.is_configured = False
@@ -382,9 +483,9 @@ class TestMainCommand:
         match_result.add(Match(song=songs[0], track=None, status=MatchStatus.NOT_FOUND))
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
             mock_spotify.return_value.is_configured = True
@@ -406,9 +507,9 @@ class TestMainCommand:
         )
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
             mock_spotify_instance = mock_spotify.return_value
@@ -436,9 +537,9 @@ class TestMainCommand:
         )
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
             mock_spotify_instance = mock_spotify.return_value
@@ -489,10 +590,10 @@ class TestFetchSongsWithCache:
         )
 
         with (
-            patch("kutx2spotify.cli.KUTXClient"),
+            patch("kutx2spotify.kutx.KUTXClient"),
             patch("kutx2spotify.cli.KUTXCache") as mock_cache,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_cache.return_value.get.return_value = cached_songs
             mock_spotify.return_value.is_configured = False
@@ -531,13 +632,13 @@ class TestFetchSongsWithCache:
         )
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
             patch("kutx2spotify.cli.KUTXCache") as mock_cache,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_cache.return_value.get.return_value = None  # Cache miss
-            mock_kutx.return_value.fetch_range.return_value = songs
+            mock_kutx.return_value.fetch_day.return_value = songs
             mock_spotify.return_value.is_configured = False
             mock_matcher.return_value.match_songs.return_value = match_result
 
@@ -547,9 +648,34 @@ class TestFetchSongsWithCache:
             )
 
         assert result.exit_code == 0
-        mock_kutx.return_value.fetch_range.assert_called_once()
+        mock_kutx.return_value.fetch_day.assert_called_once()
         mock_cache.return_value.set.assert_called_once()  # Should cache result
 
+    def test_cache_miss_caches_whole_day(self) -> None:
+        """Test that a time-limited fetch still caches every song of the day."""
+        day = [
+            make_song(title="Early", played_at=datetime(2024, 1, 15, 10, 0, 0)),
+            make_song(title="In Range", played_at=datetime(2024, 1, 15, 15, 0, 0)),
+        ]
+        kutx_client = MagicMock()
+        kutx_client.fetch_day.return_value = day
+        kutx_cache = MagicMock()
+        kutx_cache.get.return_value = None
+
+        with patch("kutx2spotify.cli.print_info"):
+            result = _fetch_songs(
+                kutx_client,
+                kutx_cache,
+                datetime(2024, 1, 15),
+                time(14, 0),
+                time(18, 0),
+                True,
+            )
+
+        assert [s.title for s in result] == ["In Range"]
+        kutx_cache.set.assert_called_once_with(datetime(2024, 1, 15), day)
+        kutx_client.fetch_range.assert_not_called()
+
 
 class TestBrowserModeFlags:
     """Tests for --browser and --login CLI flags."""
@@ -561,9 +687,10 @@ class TestBrowserModeFlags:
         songs = [make_song()]
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient"),
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
             patch("kutx2spotify.cli.asyncio.run") as mock_asyncio_run,
+            patch("kutx2spotify.cli.ResolutionCache") as mock_resolution_cache,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
 
@@ -575,6 +702,8 @@ class TestBrowserModeFlags:
         # Should call asyncio.run with browser workflow
         assert result.exit_code == 0
         mock_asyncio_run.assert_called_once()
+        mock_spotify.return_value.prepare.assert_not_called()
+        mock_resolution_cache.assert_not_called()
 
     def test_browser_flag_with_login(self) -> None:
         """Test that --login flag is passed to browser workflow."""
@@ -583,8 +712,8 @@ class TestBrowserModeFlags:
         songs = [make_song()]
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient"),
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient"),
             patch("kutx2spotify.cli.asyncio.run") as mock_asyncio_run,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
@@ -607,8 +736,8 @@ class TestBrowserModeFlags:
         songs = [make_song()]
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient"),
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient"),
             patch("kutx2spotify.cli.asyncio.run") as mock_asyncio_run,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
@@ -632,9 +761,9 @@ class TestBrowserModeFlags:
         )
 
         with (
-            patch("kutx2spotify.cli.KUTXClient") as mock_kutx,
-            patch("kutx2spotify.cli.SpotifyClient") as mock_spotify,
-            patch("kutx2spotify.cli.Matcher") as mock_matcher,
+            patch("kutx2spotify.kutx.KUTXClient") as mock_kutx,
+            patch("kutx2spotify.spotify.SpotifyClient") as mock_spotify,
+            patch("kutx2spotify.matcher.Matcher") as mock_matcher,
         ):
             mock_kutx.return_value.fetch_range.return_value = songs
             mock_spotify.return_value.is_configured = False
@@ -669,7 +798,7 @@ class TestRunBrowserWorkflow:
         mock_context.__aenter__ = AsyncMock(return_value=mock_browser)
         mock_context.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("kutx2spotify.cli.SpotifyBrowser", return_value=mock_context):
+        with patch("kutx2spotify.browser.SpotifyBrowser", return_value=mock_context):
             # Should complete successfully even with no results found
             asyncio.run(
                 _run_browser_workflow(songs, "Test Playlist", force_login=False)
@@ -688,7 +817,7 @@ class TestRunBrowserWorkflow:
         mock_context.__aenter__ = AsyncMock(return_value=mock_browser)
         mock_context.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("kutx2spotify.cli.SpotifyBrowser", return_value=mock_context):
+        with patch("kutx2spotify.browser.SpotifyBrowser", return_value=mock_context):
             with pytest.raises(SystemExit) as exc_info:
                 asyncio.run(
                     _run_browser_workflow(songs, "Test Playlist", force_login=False)
@@ -709,7 +838,7 @@ class TestRunBrowserWorkflow:
         mock_context.__aenter__ = AsyncMock(return_value=mock_browser)
         mock_context.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("kutx2spotify.cli.SpotifyBrowser", return_value=mock_context):
+        with patch("kutx2spotify.browser.SpotifyBrowser", return_value=mock_context):
             with pytest.raises(SystemExit) as exc_info:
                 asyncio.run(
                     _run_browser_workflow(songs, "Test Playlist", force_login=False)
@@ -743,7 +872,7 @@ class TestRunBrowserWorkflow:
         mock_context.__aenter__ = AsyncMock(return_value=mock_browser)
         mock_context.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("kutx2spotify.cli.SpotifyBrowser", return_value=mock_context):
+        with patch("kutx2spotify.browser.SpotifyBrowser", return_value=mock_context):
             asyncio.run(
                 _run_browser_workflow(songs, "Test Playlist", force_login=False)
             )
@@ -779,7 +908,7 @@ class TestRunBrowserWorkflow:
         mock_context.__aenter__ = AsyncMock(return_value=mock_browser)
         mock_context.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("kutx2spotify.cli.SpotifyBrowser", return_value=mock_context):
+        with patch("kutx2spotify.browser.SpotifyBrowser", return_value=mock_context):
             # Should not raise - handles gracefully
             asyncio.run(
                 _run_browser_workflow(songs, "Test Playlist", force_login=False)
@@ -802,7 +931,97 @@ class TestRunBrowserWorkflow:
         mock_context.__aenter__ = AsyncMock(return_value=mock_browser)
         mock_context.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("kutx2spotify.cli.SpotifyBrowser", return_value=mock_context):
+        with patch("kutx2spotify.browser.SpotifyBrowser", return_value=mock_context):
             asyncio.run(_run_browser_workflow(songs, "Test Playlist", force_login=True))
 
         mock_browser.ensure_logged_in.assert_called_once_with(force_login=True)
+
+
+class TestSelectTracks:
+    """Tests for _select_tracks search-ahead helper."""
+
+    @staticmethod
+    def _collect(browser: MagicMock, songs: list[Song]) -> list[tuple[Song, object]]:
+        """Drain _select_tracks, logging an add for each song it yields."""
+        import asyncio
+
+        async def run() -> list[tuple[Song, object]]:
+            out = []
+            async for song, selection in _select_tracks(browser, songs):
+                browser.log.append(f"add start {song.title}")
+                # Let a search running ahead make progress during the add
+                for _ in range(3):
+                    await asyncio.sleep(0)
+                browser.log.append(f"add end {song.title}")
+                out.append((song, selection))
+            return out
+
+        return asyncio.run(run())
+
+    def test_empty(self) -> None:
+        """Test that no songs yields nothing and searches nothing."""
+        browser = MagicMock()
+        browser.log = []
+        browser.search_tracks = AsyncMock()
+
+        assert self._collect(browser, []) == []
+        browser.search_tracks.assert_not_called()
+
+    def test_searches_one_song_ahead(self) -> None:
+        """Test the next search overlaps an add, but never runs two ahead."""
+        songs = [make_song(title=f"Song {n}") for n in (1, 2, 3)]
+        browser = MagicMock()
+        browser.log = []
+
+        async def search_tracks(query: str) -> list[SearchResult]:
+            browser.log.append(f"search {query.split()[-1]}")
+            return []
+
+        browser.search_tracks = search_tracks
+
+        result = self._collect(browser, songs)
+
+        assert [song for song, _ in result] == songs
+        assert browser.log == [
+            "search 1",
+            "add start Song 1",
+            "search 2",
+            "add end Song 1",
+            "add start Song 2",
+            "search 3",
+            "add end Song 2",
+            "add start Song 3",
+            "add end Song 3",
+        ]
+
+    def test_closing_early_cancels_search_ahead(self) -> None:
+        """Test that a caller quitting early cancels the pending search."""
+        import asyncio
+        from contextlib import aclosing
+
+        songs = [make_song(title=f"Song {n}") for n in (1, 2)]
+        browser = MagicMock()
+        cancelled = []
+
+        async def search_tracks(query: str) -> list[SearchResult]:
+            if query.endswith("2"):
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(query)
+                    raise
+            return []
+
+        browser.search_tracks = search_tracks
+
+        async def run() -> None:
+            async with aclosing(_select_tracks(browser, songs)) as selections:
+                async for _ in selections:
+                    # Let the search ahead start before quitting
+                    await asyncio.sleep(0)
+                    break
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+
+        assert cancelled == ["Test Artist Song 2"]
@@ -4,9 +4,11 @@ from datetime import datetime, time
 from unittest.mock import Mock, patch
 
 import httpx
+import orjson
 import pytest
 
-from kutx2spotify.kutx import KUTXClient
+from kutx2spotify.kutx import KUTXClient, _parse_start_time, filter_time_range
+from kutx2spotify.models import Song
 
 SAMPLE_KUTX_RESPONSE = {
     "onToday": [
@@ -142,6 +144,17 @@ class TestKUTXClientParsing:
         assert song is not None
         assert song.duration_ms == 0
 
+    def test_parse_song_null_start_time(self) -> None:
+        """Test parsing song with a null start time returns None."""
+        client = KUTXClient()
+        track_data = {
+            "_start_time": None,
+            "trackName": "Watermelon Man",
+            "artistName": "Herbie Hancock",
+        }
+        song = client._parse_song(track_data)
+        assert song is None
+
     def test_parse_song_empty_title(self) -> None:
         """Test parsing song with empty title returns None."""
         client = KUTXClient()
@@ -176,7 +189,7 @@ class TestKUTXClientFetchDay:
     def test_fetch_day_success(self, mock_client_class: Mock) -> None:
         """Test fetching day returns parsed songs."""
         mock_response = Mock()
-        mock_response.json.return_value = SAMPLE_KUTX_RESPONSE
+        mock_response.content = orjson.dumps(SAMPLE_KUTX_RESPONSE)
         mock_response.raise_for_status = Mock()
 
         mock_client_instance = Mock()
@@ -193,11 +206,30 @@ class TestKUTXClientFetchDay:
         assert songs[1].title == "Chameleon"
         assert songs[2].title == "So What"
 
+    @patch("kutx2spotify.kutx.httpx.Client")
+    def test_fetch_day_sorts_by_play_time(self, mock_client_class: Mock) -> None:
+        """Test that songs are returned in play order across program blocks."""
+        blocks = SAMPLE_KUTX_RESPONSE["onToday"]
+        mock_response = Mock()
+        mock_response.content = orjson.dumps({"onToday": [blocks[1], blocks[0]]})
+        mock_response.raise_for_status = Mock()
+
+        mock_client_instance = Mock()
+        mock_client_instance.get.return_value = mock_response
+        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
+        mock_client_instance.__exit__ = Mock(return_value=False)
+        mock_client_class.return_value = mock_client_instance
+
+        client = KUTXClient()
+        songs = client.fetch_day(datetime(2026, 1, 1))
+
+        assert [s.title for s in songs] == ["Watermelon Man", "Chameleon", "So What"]
+
     @patch("kutx2spotify.kutx.httpx.Client")
     def test_fetch_day_empty_playlist(self, mock_client_class: Mock) -> None:
         """Test fetching day with empty playlist."""
         mock_response = Mock()
-        mock_response.json.return_value = {"onToday": [{"playlist": []}]}
+        mock_response.content = orjson.dumps({"onToday": [{"playlist": []}]})
         mock_response.raise_for_status = Mock()
 
         mock_client_instance = Mock()
@@ -215,7 +247,7 @@ class TestKUTXClientFetchDay:
     def test_fetch_day_missing_ontoday_key(self, mock_client_class: Mock) -> None:
         """Test fetching day with missing onToday key."""
         mock_response = Mock()
-        mock_response.json.return_value = {}
+        mock_response.content = orjson.dumps({})
         mock_response.raise_for_status = Mock()
 
         mock_client_instance = Mock()
@@ -256,7 +288,7 @@ class TestKUTXClientFetchDay:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = response_with_invalid
+        mock_response.content = orjson.dumps(response_with_invalid)
         mock_response.raise_for_status = Mock()
 
         mock_client_instance = Mock()
@@ -294,7 +326,7 @@ class TestKUTXClientFetchDay:
     def test_fetch_day_passes_correct_params(self, mock_client_class: Mock) -> None:
         """Test fetch_day passes correct params to API."""
         mock_response = Mock()
-        mock_response.json.return_value = {"onToday": []}
+        mock_response.content = orjson.dumps({"onToday": []})
         mock_response.raise_for_status = Mock()
 
         mock_client_instance = Mock()
@@ -319,7 +351,7 @@ class TestKUTXClientFetchRange:
     def test_fetch_range_no_filters(self, mock_client_class: Mock) -> None:
         """Test fetch_range with no time filters returns all songs."""
         mock_response = Mock()
-        mock_response.json.return_value = SAMPLE_KUTX_RESPONSE
+        mock_response.content = orjson.dumps(SAMPLE_KUTX_RESPONSE)
         mock_response.raise_for_status = Mock()
 
         mock_client_instance = Mock()
@@ -337,7 +369,7 @@ class TestKUTXClientFetchRange:
     def test_fetch_range_with_start_time(self, mock_client_class: Mock) -> None:
         """Test fetch_range with start_time filter."""
         mock_response = Mock()
-        mock_response.json.return_value = SAMPLE_KUTX_RESPONSE
+        mock_response.content = orjson.dumps(SAMPLE_KUTX_RESPONSE)
         mock_response.raise_for_status = Mock()
 
         mock_client_instance = Mock()
@@ -356,7 +388,7 @@ class TestKUTXClientFetchRange:
     def test_fetch_range_with_end_time(self, mock_client_class: Mock) -> None:
         """Test fetch_range with end_time filter."""
         mock_response = Mock()
-        mock_response.json.return_value = SAMPLE_KUTX_RESPONSE
+        mock_response.content = orjson.dumps(SAMPLE_KUTX_RESPONSE)
         mock_response.raise_for_status = Mock()
 
         mock_client_instance = Mock()
@@ -376,7 +408,7 @@ class TestKUTXClientFetchRange:
     def test_fetch_range_with_both_times(self, mock_client_class: Mock) -> None:
         """Test fetch_range with both start and end time filters."""
         mock_response = Mock()
-        mock_response.json.return_value = SAMPLE_KUTX_RESPONSE
+        mock_response.content = orjson.dumps(SAMPLE_KUTX_RESPONSE)
         mock_response.raise_for_status = Mock()
 
         mock_client_instance = Mock()
@@ -400,7 +432,7 @@ class TestKUTXClientFetchRange:
     def test_fetch_range_no_matches(self, mock_client_class: Mock) -> None:
         """Test fetch_range with no matches in range."""
         mock_response = Mock()
-        mock_response.json.return_value = SAMPLE_KUTX_RESPONSE
+        mock_response.content = orjson.dumps(SAMPLE_KUTX_RESPONSE)
         mock_response.raise_for_status = Mock()
 
         mock_client_instance = Mock()
@@ -419,6 +451,91 @@ class TestKUTXClientFetchRange:
         assert len(songs) == 0
 
 
+def _song_at(hour: int, minute: int) -> Song:
+    """Create a song played at the given time on 2026-01-01."""
+    return Song(
+        title=f"{hour:02d}:{minute:02d}",
+        artist="Artist",
+        album="Album",
+        duration_ms=180000,
+        played_at=datetime(2026, 1, 1, hour, minute),
+    )
+
+
+class TestParseStartTime:
+    """Tests for _parse_start_time helper."""
+
+    def test_zero_padded(self) -> None:
+        """Test the form the API sends."""
+        assert _parse_start_time("01-02-2026 14:30:05") == datetime(
+            2026, 1, 2, 14, 30, 5
+        )
+
+    def test_unpadded_falls_back(self) -> None:
+        """Test fields without zero padding are still accepted."""
+        assert _parse_start_time("1-2-2026 9:05:00") == datetime(2026, 1, 2, 9, 5)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "13-01-2026 10:00:00",
+            "01-01-2026 24:00:00",
+            "ab-01-2026 10:00:00",
+            "01-01-2026 10:00:0Z",
+            "2026-01-01 10:00:00",
+            "",
+        ],
+    )
+    def test_invalid(self, value: str) -> None:
+        """Test malformed or out-of-range start times are rejected."""
+        with pytest.raises(ValueError):
+            _parse_start_time(value)
+
+
+class TestFilterTimeRange:
+    """Tests for filter_time_range function."""
+
+    def test_no_bounds(self) -> None:
+        """Test that no bounds returns every song."""
+        songs = [_song_at(9, 0), _song_at(12, 0)]
+
+        assert filter_time_range(songs, datetime(2026, 1, 1)) == songs
+
+    def test_bounds_are_inclusive(self) -> None:
+        """Test that songs exactly at either bound are kept."""
+        songs = [_song_at(h, 0) for h in range(9, 18)]
+
+        result = filter_time_range(
+            songs, datetime(2026, 1, 1), start_time=time(12, 0), end_time=time(14, 0)
+        )
+
+        assert [s.title for s in result] == ["12:00", "13:00", "14:00"]
+
+    def test_start_only(self) -> None:
+        """Test filtering with only a start time."""
+        songs = [_song_at(9, 0), _song_at(12, 0), _song_at(15, 30)]
+
+        result = filter_time_range(songs, datetime(2026, 1, 1), start_time=time(12, 1))
+
+        assert [s.title for s in result] == ["15:30"]
+
+    def test_end_only(self) -> None:
+        """Test filtering with only an end time."""
+        songs = [_song_at(9, 0), _song_at(12, 0), _song_at(15, 30)]
+
+        result = filter_time_range(songs, datetime(2026, 1, 1), end_time=time(11, 59))
+
+        assert [s.title for s in result] == ["09:00"]
+
+    def test_empty(self) -> None:
+        """Test filtering an empty list."""
+        result = filter_time_range(
+            [], datetime(2026, 1, 1), start_time=time(9, 0), end_time=time(17, 0)
+        )
+
+        assert result == []
+
+
 class TestKUTXClientInit:
     """Tests for KUTXClient initialization."""
 
@@ -431,3 +548,49 @@ class TestKUTXClientInit:
         """Test client accepts custom base URL."""
         client = KUTXClient(base_url="https://custom.api.com/playlist")
         assert client.base_url == "https://custom.api.com/playlist"
+
+
+class TestKUTXClientConnections:
+    """Tests for the shared HTTP connection pool."""
+
+    @patch("kutx2spotify.kutx.httpx.Client")
+    def test_pool_created_lazily(self, mock_client_class: Mock) -> None:
+        """Test no connection pool exists until the first request."""
+        KUTXClient()
+
+        mock_client_class.assert_not_called()
+
+    @patch("kutx2spotify.kutx.httpx.Client")
+    def test_pool_reused_across_days(self, mock_client_class: Mock) -> None:
+        """Test that fetching several days shares one HTTP client."""
+        mock_response = Mock()
+        mock_response.content = orjson.dumps(SAMPLE_KUTX_RESPONSE)
+        mock_client_class.return_value.get.return_value = mock_response
+
+        client = KUTXClient()
+        client.fetch_day(datetime(2026, 1, 1))
+        client.fetch_day(datetime(2026, 1, 2))
+
+        mock_client_class.assert_called_once()
+        assert mock_client_class.return_value.get.call_count == 2
+
+    @patch("kutx2spotify.kutx.httpx.Client")
+    def test_close(self, mock_client_class: Mock) -> None:
+        """Test close() releases the pool and a later request opens a new one."""
+        mock_response = Mock()
+        mock_response.content = orjson.dumps(SAMPLE_KUTX_RESPONSE)
+        mock_client_class.return_value.get.return_value = mock_response
+
+        with KUTXClient() as client:
+            client.fetch_day(datetime(2026, 1, 1))
+        mock_client_class.return_value.close.assert_called_once()
+
+        client.fetch_day(datetime(2026, 1, 2))
+        assert mock_client_class.call_count == 2
+
+    def test_close_unused(self) -> None:
+        """Test close() before any request is a no-op."""
+        client = KUTXClient()
+
+        client.close()
+        client.close()
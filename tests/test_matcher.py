@@ -1,6 +1,8 @@
 """Tests for the matching engine."""
 
 import os
+import threading
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -50,7 +52,7 @@ def mock_spotify() -> MagicMock:
 @pytest.fixture
 def resolution_cache(tmp_path: Path) -> ResolutionCache:
     """Create a resolution cache for testing."""
-    cache_path = tmp_path / "resolutions.json"
+    cache_path = tmp_path / "resolutions.db"
     return ResolutionCache(cache_path=cache_path)
 
 
@@ -98,6 +100,11 @@ class TestAlbumsMatch:
         matcher = Matcher(spotify_client=mock_spotify)
         assert matcher._albums_match("", "") is True
 
+    def test_ignores_spacing(self, mock_spotify: MagicMock) -> None:
+        """Test albums differing only in whitespace match."""
+        matcher = Matcher(spotify_client=mock_spotify)
+        assert matcher._albums_match("Head  Hunters ", "head hunters") is True
+
 
 class TestDurationTolerance:
     """Tests for _is_within_duration_tolerance helper."""
@@ -324,6 +331,61 @@ class TestFindBestFallback:
         assert result.id == "track-1"  # Prefers within tolerance
         assert within is True
 
+    def test_popularity_tie_keeps_first(
+        self, mock_spotify: MagicMock, sample_song: Song
+    ) -> None:
+        """Test the first of equally popular tracks is chosen."""
+        tracks = [
+            SpotifyTrack(
+                id=f"track-{i}",
+                uri=f"spotify:track:track-{i}",
+                title="Watermelon Man",
+                artist="Herbie Hancock",
+                album="Live Album",
+                duration_ms=sample_song.duration_ms,
+                popularity=50,
+            )
+            for i in range(3)
+        ]
+        mock_spotify.search_tracks.return_value = tracks
+        matcher = Matcher(spotify_client=mock_spotify)
+
+        track, within_tolerance = matcher._find_best_fallback(sample_song)
+
+        assert track is tracks[0]
+        assert within_tolerance is True
+
+    def test_tolerance_bounds_inclusive(
+        self, mock_spotify: MagicMock, sample_song: Song
+    ) -> None:
+        """Test tracks exactly at either tolerance bound count as within."""
+        # (duration offset, popularity): the in-bounds pair is least popular
+        candidates = [
+            (-DURATION_TOLERANCE_MS - 1, 90),
+            (-DURATION_TOLERANCE_MS, 10),
+            (DURATION_TOLERANCE_MS, 20),
+            (DURATION_TOLERANCE_MS + 1, 80),
+        ]
+        tracks = [
+            SpotifyTrack(
+                id=f"track-{i}",
+                uri=f"spotify:track:track-{i}",
+                title="Watermelon Man",
+                artist="Herbie Hancock",
+                album="Live Album",
+                duration_ms=sample_song.duration_ms + offset,
+                popularity=popularity,
+            )
+            for i, (offset, popularity) in enumerate(candidates)
+        ]
+        mock_spotify.search_tracks.return_value = tracks
+        matcher = Matcher(spotify_client=mock_spotify)
+
+        track, within_tolerance = matcher._find_best_fallback(sample_song)
+
+        assert track is tracks[2]
+        assert within_tolerance is True
+
 
 class TestCheckResolutionCache:
     """Tests for _check_resolution_cache helper."""
@@ -570,7 +632,10 @@ class TestMatchSongs:
             duration_ms=182000,
             popularity=80,
         )
-        mock_spotify.search_track.side_effect = [track1, None]
+        # Keyed by title: songs are matched on worker threads in any order
+        mock_spotify.search_track.side_effect = lambda title, **_: (
+            track1 if title == "Song 1" else None
+        )
         mock_spotify.search_tracks.return_value = []
 
         matcher = Matcher(spotify_client=mock_spotify)
@@ -619,6 +684,215 @@ class TestMatchSongs:
             assert result.matches[0].status == MatchStatus.NOT_FOUND
 
 
+class TestMatchSongsConcurrency:
+    """Tests for concurrent searching in match_songs."""
+
+    def test_searches_run_concurrently(self, mock_spotify: MagicMock) -> None:
+        """Test that searches for different songs overlap."""
+        songs = [
+            Song(
+                title=f"Song {i}",
+                artist="Artist",
+                album="Album",
+                duration_ms=200000,
+                played_at=datetime(2026, 1, 1, 12, i, 0),
+            )
+            for i in range(4)
+        ]
+        barrier = threading.Barrier(len(songs), timeout=5)
+
+        def search_track(**_: str) -> None:
+            barrier.wait()  # Only returns once every song is searching
+            return None
+
+        mock_spotify.search_track.side_effect = search_track
+        mock_spotify.search_tracks.return_value = []
+        matcher = Matcher(spotify_client=mock_spotify)
+
+        result = matcher.match_songs(songs)
+
+        assert [m.song for m in result.matches] == songs
+        assert all(m.status == MatchStatus.NOT_FOUND for m in result.matches)
+
+    def test_authorizes_once_before_searching(self, mock_spotify: MagicMock) -> None:
+        """Test that login happens once, before the searches fan out."""
+        songs = [
+            Song(
+                title=f"Song {i}",
+                artist="Artist",
+                album="Album",
+                duration_ms=200000,
+                played_at=datetime(2026, 1, 1, 12, i, 0),
+            )
+            for i in range(4)
+        ]
+        calls: list[str] = []
+        mock_spotify.authorize.side_effect = lambda: calls.append("authorize")
+        mock_spotify.search_track.side_effect = lambda **_: calls.append("search")
+        mock_spotify.search_tracks.return_value = []
+        matcher = Matcher(spotify_client=mock_spotify)
+
+        matcher.match_songs(songs)
+
+        mock_spotify.authorize.assert_called_once_with()
+        assert calls == ["authorize"] + ["search"] * len(songs)
+
+    def test_keeps_order_with_cached_songs(
+        self, mock_spotify: MagicMock, resolution_cache: ResolutionCache
+    ) -> None:
+        """Test that cached and searched songs keep their input order."""
+        songs = [
+            Song(
+                title=f"Song {i}",
+                artist="Artist",
+                album="Album",
+                duration_ms=200000,
+                played_at=datetime(2026, 1, 1, 12, i, 0),
+            )
+            for i in range(3)
+        ]
+        resolution_cache.set(
+            songs[1],
+            Resolution(spotify_uri="spotify:track:cached", resolved_album="Album"),
+        )
+        mock_spotify.search_track.return_value = None
+        mock_spotify.search_tracks.return_value = []
+        matcher = Matcher(
+            spotify_client=mock_spotify, resolution_cache=resolution_cache
+        )
+
+        result = matcher.match_songs(songs)
+
+        assert [m.song for m in result.matches] == songs
+        assert result.matches[1].track is not None
+        assert result.matches[1].track.uri == "spotify:track:cached"
+        assert mock_spotify.search_track.call_count == 2
+
+    def test_repeated_songs_searched_once(
+        self, mock_spotify: MagicMock, sample_song: Song, sample_track: SpotifyTrack
+    ) -> None:
+        """Test that a song played several times costs one search."""
+        replay = replace(sample_song, played_at=datetime(2026, 1, 1, 18, 0, 0))
+        songs = [sample_song, replay, sample_song]
+        mock_spotify.search_track.return_value = sample_track
+        matcher = Matcher(spotify_client=mock_spotify)
+
+        result = matcher.match_songs(songs)
+
+        mock_spotify.search_track.assert_called_once()
+        assert [m.song for m in result.matches] == songs
+        assert result.matches[1].song.played_at == replay.played_at
+        assert all(m.track == sample_track for m in result.matches)
+        assert all(m.status == MatchStatus.EXACT for m in result.matches)
+
+    def test_repeated_songs_checked_once(
+        self,
+        mock_spotify: MagicMock,
+        sample_song: Song,
+        resolution_cache: ResolutionCache,
+    ) -> None:
+        """Test repeats of a resolved song share one cache lookup and track."""
+        resolution_cache.set(
+            sample_song,
+            Resolution(spotify_uri="spotify:track:abc", resolved_album="Head Hunters"),
+        )
+        replay = replace(sample_song, played_at=datetime(2026, 1, 1, 18, 0, 0))
+        matcher = Matcher(
+            spotify_client=mock_spotify, resolution_cache=resolution_cache
+        )
+
+        with patch.object(
+            resolution_cache, "get", wraps=resolution_cache.get
+        ) as spy_get:
+            result = matcher.match_songs([sample_song, replay])
+
+        spy_get.assert_called_once()
+        assert [m.song for m in result.matches] == [sample_song, replay]
+        assert result.matches[0].track is result.matches[1].track
+        mock_spotify.search_track.assert_not_called()
+
+
+class TestMissCache:
+    """Tests for skipping songs that recently failed to match."""
+
+    def test_not_found_is_recorded(
+        self,
+        mock_spotify: MagicMock,
+        sample_song: Song,
+        resolution_cache: ResolutionCache,
+    ) -> None:
+        """Test a song with no results is stored as a miss."""
+        mock_spotify.search_track.return_value = None
+        mock_spotify.search_tracks.return_value = []
+        matcher = Matcher(
+            spotify_client=mock_spotify, resolution_cache=resolution_cache
+        )
+
+        result = matcher.match_song(sample_song)
+
+        assert result.status == MatchStatus.NOT_FOUND
+        assert resolution_cache.is_miss(sample_song) is True
+
+    def test_found_is_not_recorded(
+        self,
+        mock_spotify: MagicMock,
+        sample_song: Song,
+        sample_track: SpotifyTrack,
+        resolution_cache: ResolutionCache,
+    ) -> None:
+        """Test a successful search leaves no miss behind."""
+        mock_spotify.search_track.return_value = sample_track
+        matcher = Matcher(
+            spotify_client=mock_spotify, resolution_cache=resolution_cache
+        )
+
+        matcher.match_songs([sample_song])
+
+        assert resolution_cache.is_miss(sample_song) is False
+
+    def test_known_miss_skips_search(
+        self,
+        mock_spotify: MagicMock,
+        sample_song: Song,
+        resolution_cache: ResolutionCache,
+    ) -> None:
+        """Test a recorded miss is answered without calling Spotify."""
+        resolution_cache.add_miss(sample_song)
+        matcher = Matcher(
+            spotify_client=mock_spotify, resolution_cache=resolution_cache
+        )
+
+        single = matcher.match_song(sample_song)
+        batch = matcher.match_songs([sample_song])
+
+        assert single.status == MatchStatus.NOT_FOUND
+        assert batch.matches[0].status == MatchStatus.NOT_FOUND
+        mock_spotify.search_track.assert_not_called()
+        mock_spotify.search_tracks.assert_not_called()
+
+    def test_resolution_beats_miss(
+        self,
+        mock_spotify: MagicMock,
+        sample_song: Song,
+        resolution_cache: ResolutionCache,
+    ) -> None:
+        """Test a stored resolution wins over an older miss."""
+        resolution_cache.add_miss(sample_song)
+        resolution_cache.set(
+            sample_song,
+            Resolution(spotify_uri="spotify:track:abc", resolved_album="Head Hunters"),
+        )
+        matcher = Matcher(
+            spotify_client=mock_spotify, resolution_cache=resolution_cache
+        )
+
+        result = matcher.match_song(sample_song)
+
+        assert result.status == MatchStatus.EXACT
+        assert result.track is not None
+        assert result.track.uri == "spotify:track:abc"
+
+
 class TestMatchSongEdgeCases:
     """Tests for edge cases in matching."""
 
@@ -723,6 +997,41 @@ class TestMatchSongEdgeCases:
         assert result.status == MatchStatus.DURATION_MISMATCH
 
 
+class TestSearchReuse:
+    """Tests for avoiding repeated Spotify searches."""
+
+    def test_no_album_skips_exact_search(
+        self, mock_spotify: MagicMock, sample_song: Song, sample_track: SpotifyTrack
+    ) -> None:
+        """Test a song without an album goes straight to the fallback search."""
+        song = replace(sample_song, album="")
+        mock_spotify.search_tracks.return_value = [sample_track]
+        matcher = Matcher(spotify_client=mock_spotify)
+
+        result = matcher.match_song(song)
+
+        mock_spotify.search_track.assert_not_called()
+        assert result.track is sample_track
+        assert result.status == MatchStatus.ALBUM_FALLBACK
+
+    def test_fallback_search_shared_across_albums(
+        self, mock_spotify: MagicMock, sample_song: Song, sample_track: SpotifyTrack
+    ) -> None:
+        """Test songs differing only in album reuse one fallback search."""
+        other = replace(sample_song, album="Greatest Hits")
+        mock_spotify.search_track.return_value = None
+        mock_spotify.search_tracks.return_value = [sample_track]
+        matcher = Matcher(spotify_client=mock_spotify)
+
+        first = matcher.match_song(sample_song)
+        second = matcher.match_song(other)
+
+        mock_spotify.search_tracks.assert_called_once()
+        assert mock_spotify.search_track.call_count == 2
+        assert first.status == MatchStatus.EXACT
+        assert second.status == MatchStatus.ALBUM_FALLBACK
+
+
 class TestDurationToleranceConstant:
     """Tests for duration tolerance constant."""
 
@@ -1,5 +1,6 @@
 """Tests for data models."""
 
+from dataclasses import replace
 from datetime import datetime
 
 from kutx2spotify.models import (
@@ -72,6 +73,52 @@ class TestSong:
         )
         assert song.duration_display() == "3:05"
 
+    def test_lookup_key(self) -> None:
+        """Test lookup_key is precomputed and lowercase."""
+        song = Song(
+            title="Watermelon Man",
+            artist="Herbie Hancock",
+            album="Head Hunters",
+            duration_ms=252000,
+            played_at=datetime(2026, 1, 1, 14, 30, 0),
+        )
+        assert song.lookup_key == "watermelon man|herbie hancock|head hunters"
+
+    def test_lookup_key_folds_case_and_whitespace(self) -> None:
+        """Test lookup_key casefolds and collapses whitespace per field."""
+        song = Song(
+            title="  Straße   Song ",
+            artist="The\tBand",
+            album="ÉCLAT",
+            duration_ms=180000,
+            played_at=datetime(2026, 1, 1, 14, 30, 0),
+        )
+        assert song.lookup_key == "strasse song|the band|éclat"
+
+    def test_lookup_key_not_part_of_equality(self) -> None:
+        """Test lookup_key does not change equality or repr."""
+        song = Song(
+            title="Test",
+            artist="Artist",
+            album="Album",
+            duration_ms=180000,
+            played_at=datetime(2026, 1, 1, 14, 30, 0),
+        )
+        assert song == replace(song)
+        assert "lookup_key" not in repr(song)
+
+    def test_album_key(self) -> None:
+        """Test album_key is the normalized album, kept out of repr."""
+        song = Song(
+            title="Test",
+            artist="Artist",
+            album="  Head   HUNTERS ",
+            duration_ms=180000,
+            played_at=datetime(2026, 1, 1, 14, 30, 0),
+        )
+        assert song.album_key == "head hunters"
+        assert "album_key" not in repr(song)
+
 
 class TestSpotifyTrack:
     """Tests for SpotifyTrack dataclass."""
@@ -107,6 +154,32 @@ class TestSpotifyTrack:
         )
         assert track.popularity == 85
 
+    def test_uses_slots(self) -> None:
+        """Test that tracks carry no per-instance dict."""
+        track = SpotifyTrack(
+            id="abc123",
+            uri="spotify:track:abc123",
+            title="Watermelon Man",
+            artist="Herbie Hancock",
+            album="Head Hunters",
+            duration_ms=252000,
+        )
+        assert not hasattr(track, "__dict__")
+
+    def test_album_key(self) -> None:
+        """Test album_key is precomputed and ignored by equality."""
+        track = SpotifyTrack(
+            id="abc123",
+            uri="spotify:track:abc123",
+            title="Watermelon Man",
+            artist="Herbie Hancock",
+            album="Head  Hunters",
+            duration_ms=252000,
+        )
+        assert track.album_key == "head hunters"
+        assert track == replace(track)
+        assert "album_key" not in repr(track)
+
 
 class TestMatchStatus:
     """Tests for MatchStatus enum."""
@@ -194,6 +267,18 @@ class TestMatch:
         match = Match(song=song, track=None, status=MatchStatus.NOT_FOUND)
         assert match.has_issue
 
+    def test_uses_slots(self) -> None:
+        """Test that matches carry no per-instance dict."""
+        song = Song(
+            title="Test",
+            artist="Artist",
+            album="Album",
+            duration_ms=180000,
+            played_at=datetime(2026, 1, 1, 14, 30, 0),
+        )
+        match = Match(song=song, track=None, status=MatchStatus.NOT_FOUND)
+        assert not hasattr(match, "__dict__")
+
 
 class TestMatchResult:
     """Tests for MatchResult dataclass."""
@@ -206,6 +291,8 @@ class TestMatchResult:
         assert result.not_found == 0
         assert result.exact_matches == 0
         assert result.issues == []
+        assert result.issue_count == 0
+        assert list(result.iter_issues()) == []
 
     def test_add_match(self) -> None:
         """Test adding a match."""
@@ -286,3 +373,51 @@ class TestMatchResult:
         assert result.not_found == 1
         assert result.exact_matches == 1
         assert len(result.issues) == 2
+        assert result.issue_count == 2
+        assert [idx for idx, _ in result.iter_issues()] == [2, 3]
+        assert [m for _, m in result.iter_issues()] == result.issues
+
+    def test_counts_initial_matches(self) -> None:
+        """Test matches passed to the constructor are counted like add()."""
+        song = Song(
+            title="Test",
+            artist="Artist",
+            album="Album",
+            duration_ms=180000,
+            played_at=datetime(2026, 1, 1, 14, 30, 0),
+        )
+        track = SpotifyTrack(
+            id="abc123",
+            uri="spotify:track:abc123",
+            title="Test",
+            artist="Artist",
+            album="Album",
+            duration_ms=180000,
+        )
+        exact = Match(song=song, track=track, status=MatchStatus.EXACT)
+        missing = Match(song=song, track=None, status=MatchStatus.NOT_FOUND)
+
+        result = MatchResult(matches=[exact, missing])
+
+        assert result.matches == [exact, missing]
+        assert result.found == 1
+        assert result.not_found == 1
+        assert result.exact_matches == 1
+        assert result.issues == [missing]
+        assert result == MatchResult(matches=[exact, missing])
+
+    def test_issues_is_a_copy(self) -> None:
+        """Test changing the returned issues list leaves the result intact."""
+        song = Song(
+            title="Test",
+            artist="Artist",
+            album="Album",
+            duration_ms=180000,
+            played_at=datetime(2026, 1, 1, 14, 30, 0),
+        )
+        result = MatchResult()
+        result.add(Match(song=song, track=None, status=MatchStatus.NOT_FOUND))
+
+        result.issues.clear()
+
+        assert len(result.issues) == 1
@@ -3,12 +3,16 @@
 from datetime import datetime
 from io import StringIO
 from unittest.mock import MagicMock, patch
+from urllib.parse import quote_plus
 
+import pytest
 from rich.console import Console
 
+from kutx2spotify import output
 from kutx2spotify.browser import SearchResult, SelectionResult
 from kutx2spotify.models import Match, MatchResult, MatchStatus, Song, SpotifyTrack
 from kutx2spotify.output import (
+    buffered_output,
     format_duration,
     format_duration_diff,
     generate_spotify_search_url,
@@ -85,6 +89,16 @@ class TestFormatDuration:
         """Test zero duration."""
         assert format_duration(0) == "0:00"
 
+    def test_format_duration_drops_milliseconds(self) -> None:
+        """Test partial seconds are truncated."""
+        assert format_duration(59999) == "0:59"
+
+    def test_format_duration_is_memoized(self) -> None:
+        """Test repeated durations reuse the formatted string."""
+        first = format_duration(252000)
+
+        assert format_duration(252000) is first
+
 
 class TestFormatDurationDiff:
     """Tests for format_duration_diff function."""
@@ -101,6 +115,10 @@ class TestFormatDurationDiff:
         """Test zero duration difference."""
         assert format_duration_diff(0) == "+0s"
 
+    def test_partial_negative_diff_rounds_down(self) -> None:
+        """Test a sub-second negative difference rounds toward -1s."""
+        assert format_duration_diff(-500) == "-1s"
+
 
 class TestGenerateSpotifySearchUrl:
     """Tests for generate_spotify_search_url function."""
@@ -116,6 +134,79 @@ class TestGenerateSpotifySearchUrl:
         url = generate_spotify_search_url("Don't Stop", "Artist")
         assert "%27" in url or "Don" in url  # URL encoded apostrophe or encoded
 
+    @pytest.mark.parametrize(
+        ("title", "artist"),
+        [
+            ("Watermelon Man", "Herbie Hancock"),
+            ("So_What-2.0~", "Miles  Davis"),
+            ("Don't Stop", "Artist"),
+            ("A/B?C#D&E=F+G%", "H"),
+            ("Café Tacvba", "Björk"),
+            ("", ""),
+        ],
+    )
+    def test_matches_quote_plus(self, title: str, artist: str) -> None:
+        """Test both encoding paths match quote_plus() exactly."""
+        url = generate_spotify_search_url(title, artist)
+
+        assert url == "https://open.spotify.com/search/" + quote_plus(
+            f"{title} {artist}"
+        )
+
+
+class TestConsole:
+    """Tests for the lazily created console."""
+
+    def test_console_created_once(self) -> None:
+        """Test the console is created on first use and then reused."""
+        output._get_console.cache_clear()
+
+        created = output._get_console()
+
+        assert isinstance(created, Console)
+        assert output._get_console() is created
+
+
+class TestBufferedOutput:
+    """Tests for buffered_output context manager."""
+
+    def test_redirected_output_written_on_exit(self) -> None:
+        """Test output to a non-terminal is held until the block ends."""
+        output = StringIO()
+        console = Console(file=output, no_color=True)
+        with (
+            patch("kutx2spotify.output._get_console", return_value=console),
+            buffered_output(),
+        ):
+            print_info("first")
+            print_info("second")
+            assert output.getvalue() == ""
+        assert output.getvalue() == "first\nsecond\n"
+
+    def test_redirected_output_written_on_error(self) -> None:
+        """Test held output is still written when the block raises."""
+        output = StringIO()
+        console = Console(file=output, no_color=True)
+        with (
+            patch("kutx2spotify.output._get_console", return_value=console),
+            pytest.raises(RuntimeError),
+            buffered_output(),
+        ):
+            print_info("before error")
+            raise RuntimeError
+        assert output.getvalue() == "before error\n"
+
+    def test_terminal_output_not_held(self) -> None:
+        """Test output to a terminal is written as it is printed."""
+        output = StringIO()
+        console = Console(file=output, force_terminal=True, no_color=True)
+        with (
+            patch("kutx2spotify.output._get_console", return_value=console),
+            buffered_output(),
+        ):
+            print_info("first")
+            assert "first" in output.getvalue()
+
 
 class TestPrintPlaylistHeader:
     """Tests for print_playlist_header function."""
@@ -123,7 +214,10 @@ class TestPrintPlaylistHeader:
     def test_header_with_date_only(self) -> None:
         """Test header with date only."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_playlist_header("2024-01-15")
         result = output.getvalue()
         assert "KUTX Playlist: 2024-01-15" in result
@@ -131,7 +225,10 @@ class TestPrintPlaylistHeader:
     def test_header_with_time_range(self) -> None:
         """Test header with start and end time."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_playlist_header("2024-01-15", "14:00", "18:00")
         result = output.getvalue()
         assert "2024-01-15" in result
@@ -141,7 +238,10 @@ class TestPrintPlaylistHeader:
     def test_header_with_start_only(self) -> None:
         """Test header with start time only."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_playlist_header("2024-01-15", start_time="14:00")
         result = output.getvalue()
         assert "14:00" in result
@@ -150,7 +250,10 @@ class TestPrintPlaylistHeader:
     def test_header_with_end_only(self) -> None:
         """Test header with end time only."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_playlist_header("2024-01-15", end_time="18:00")
         result = output.getvalue()
         assert "start of day" in result
@@ -168,7 +271,10 @@ class TestPrintMatchList:
         )
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_match_list(result)
         text = output.getvalue()
         assert "Test Song" in text
@@ -180,7 +286,10 @@ class TestPrintMatchList:
         result.add(Match(song=make_song(), track=None, status=MatchStatus.NOT_FOUND))
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_match_list(result)
         text = output.getvalue()
         assert "*" in text
@@ -202,12 +311,49 @@ class TestPrintMatchList:
         )
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_match_list(result)
         text = output.getvalue()
         assert "Song 1" in text
         assert "Song 2" in text
 
+    def test_single_write(self) -> None:
+        """Test the whole list is printed with one console call."""
+        result = MatchResult()
+        for n in range(3):
+            result.add(
+                Match(
+                    song=make_song(title=f"Song {n}"),
+                    track=None,
+                    status=MatchStatus.NOT_FOUND,
+                )
+            )
+
+        output = StringIO()
+        console = Console(file=output, no_color=True)
+        with (
+            patch("kutx2spotify.output._get_console", return_value=console),
+            patch.object(console, "print", wraps=console.print) as spy,
+        ):
+            print_match_list(result)
+
+        spy.assert_called_once()
+        assert output.getvalue().count("\n") == 3
+
+    def test_empty_result_prints_nothing(self) -> None:
+        """Test an empty result prints no lines."""
+        output = StringIO()
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
+            print_match_list(MatchResult())
+
+        assert output.getvalue() == ""
+
 
 class TestPrintIssues:
     """Tests for print_issues function."""
@@ -220,7 +366,10 @@ class TestPrintIssues:
         )
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_issues(result)
         text = output.getvalue()
         assert "ISSUES" not in text
@@ -231,7 +380,10 @@ class TestPrintIssues:
         result.add(Match(song=make_song(), track=None, status=MatchStatus.NOT_FOUND))
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_issues(result)
         text = output.getvalue()
         assert "ISSUES" in text
@@ -245,7 +397,10 @@ class TestPrintIssues:
         result.add(Match(song=song, track=track, status=MatchStatus.DURATION_MISMATCH))
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_issues(result)
         text = output.getvalue()
         assert "ISSUES" in text
@@ -262,12 +417,39 @@ class TestPrintManualLinks:
         result.add(Match(song=make_song(), track=None, status=MatchStatus.NOT_FOUND))
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_manual_links(result)
         text = output.getvalue()
         assert "Manual Search Links" in text
         assert "open.spotify.com/search" in text
 
+    def test_titles_are_not_markup(self) -> None:
+        """Test bracketed titles print literally, one line per song."""
+        result = MatchResult()
+        for title in ("Song [Live]", "Other [bold]Song"):
+            result.add(
+                Match(
+                    song=make_song(title=title),
+                    track=None,
+                    status=MatchStatus.NOT_FOUND,
+                )
+            )
+
+        output = StringIO()
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True, width=200),
+        ):
+            print_manual_links(result)
+        lines = output.getvalue().splitlines()
+
+        assert lines[-4] == " 1. Song [Live] - Test Artist"
+        assert lines[-2] == " 2. Other [bold]Song - Test Artist"
+        assert lines[-1].startswith("    https://open.spotify.com/search/")
+
 
 class TestPrintSummary:
     """Tests for print_summary function."""
@@ -280,7 +462,10 @@ class TestPrintSummary:
         )
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_summary(result)
         text = output.getvalue()
         assert "Total tracks: 1" in text
@@ -294,7 +479,10 @@ class TestPrintSummary:
         )
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_summary(result, preview=True)
         text = output.getvalue()
         assert "Preview mode" in text
@@ -305,7 +493,10 @@ class TestPrintSummary:
         result.add(Match(song=make_song(), track=None, status=MatchStatus.NOT_FOUND))
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_summary(result)
         text = output.getvalue()
         assert "Issues: 1" in text
@@ -317,7 +508,10 @@ class TestPrintPlaylistCreated:
     def test_playlist_created_output(self) -> None:
         """Test playlist created message."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_playlist_created(
                 url="https://open.spotify.com/playlist/123",
                 name="My Playlist",
@@ -336,7 +530,10 @@ class TestUtilityPrints:
     def test_print_error(self) -> None:
         """Test error printing."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_error("Something went wrong")
         text = output.getvalue()
         assert "Error: Something went wrong" in text
@@ -344,7 +541,10 @@ class TestUtilityPrints:
     def test_print_warning(self) -> None:
         """Test warning printing."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_warning("Be careful")
         text = output.getvalue()
         assert "Warning: Be careful" in text
@@ -352,7 +552,10 @@ class TestUtilityPrints:
     def test_print_info(self) -> None:
         """Test info printing."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_info("Here is some info")
         text = output.getvalue()
         assert "Here is some info" in text
@@ -381,7 +584,10 @@ class TestPrintBrowserHeader:
     def test_browser_header_basic(self) -> None:
         """Test basic browser header."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_browser_header("KUTX 2025-12-31")
         text = output.getvalue()
         assert "Creating playlist: KUTX 2025-12-31 (private)" in text
@@ -390,7 +596,10 @@ class TestPrintBrowserHeader:
     def test_browser_header_custom_name(self) -> None:
         """Test browser header with custom name."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_browser_header("My Custom Playlist")
         text = output.getvalue()
         assert "My Custom Playlist" in text
@@ -408,7 +617,10 @@ class TestPrintBrowserTrackAdded:
         )
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_browser_track_added(1, song, selection)
         text = output.getvalue()
         assert "Test Song" in text
@@ -424,7 +636,10 @@ class TestPrintBrowserTrackAdded:
         )
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_browser_track_added(1, song, selection)
         text = output.getvalue()
         assert "[album_match: +15s]" in text
@@ -439,8 +654,8 @@ class TestPrintBrowserTrackAdded:
 
         output = StringIO()
         with patch(
-            "kutx2spotify.output.console",
-            Console(file=output, no_color=True, width=200),
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True, width=200),
         ):
             print_browser_track_added(1, song, selection)
         text = output.getvalue()
@@ -457,7 +672,10 @@ class TestPrintBrowserTrackAdded:
         )
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_browser_track_added(1, song, selection)
         text = output.getvalue()
         assert "[first_result]" in text
@@ -473,7 +691,10 @@ class TestPrintBrowserTrackAdded:
         )
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_browser_track_added(1, song, selection)
         text = output.getvalue()
         assert "Other options:" in text
@@ -486,7 +707,10 @@ class TestPrintBrowserTrackAdded:
         selection = SelectionResult(selected=None, reason="no_results", alternatives=[])
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_browser_track_added(1, song, selection)
         text = output.getvalue()
         # Should not print anything
@@ -501,7 +725,10 @@ class TestPrintBrowserTrackSkipped:
         song = make_song()
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_browser_track_skipped(1, song, "no results")
         text = output.getvalue()
         assert "Test Song" in text
@@ -513,7 +740,10 @@ class TestPrintBrowserTrackSkipped:
         song = make_song(title="Obscure Song", artist="Unknown Artist")
 
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_browser_track_skipped(4, song, "failed to add")
         text = output.getvalue()
         assert "Obscure Song" in text
@@ -527,7 +757,10 @@ class TestPrintBrowserSummary:
     def test_summary_all_added(self) -> None:
         """Test summary when all tracks added."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_browser_summary(
                 added=10,
                 skipped=0,
@@ -542,7 +775,10 @@ class TestPrintBrowserSummary:
     def test_summary_some_skipped(self) -> None:
         """Test summary with some tracks skipped."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_browser_summary(
                 added=7,
                 skipped=3,
@@ -555,7 +791,10 @@ class TestPrintBrowserSummary:
     def test_summary_all_skipped(self) -> None:
         """Test summary when all tracks skipped."""
         output = StringIO()
-        with patch("kutx2spotify.output.console", Console(file=output, no_color=True)):
+        with patch(
+            "kutx2spotify.output._get_console",
+            return_value=Console(file=output, no_color=True),
+        ):
             print_browser_summary(
                 added=0,
                 skipped=5,
@@ -37,6 +37,16 @@ class TestSpotifyNotConfiguredError:
             assert "SPOTIPY_CLIENT_SECRET" in message
             assert "SPOTIPY_REDIRECT_URI" in message
 
+    def test_error_message_uses_given_missing_vars(self) -> None:
+        """Test error message lists the given variables without reading env."""
+        with patch.dict(os.environ, {}, clear=True):
+            error = SpotifyNotConfiguredError(("SPOTIPY_CLIENT_SECRET",))
+            message = str(error)
+
+            assert "SPOTIPY_CLIENT_SECRET" in message
+            assert "SPOTIPY_CLIENT_ID" not in message
+            assert "SPOTIPY_REDIRECT_URI" not in message
+
 
 class TestSpotifyClientIsConfigured:
     """Tests for is_configured property."""
@@ -80,6 +90,20 @@ class TestSpotifyClientIsConfigured:
             client = SpotifyClient()
             assert client.is_configured is False
 
+    def test_is_configured_reads_environment_once(self) -> None:
+        """Test is_configured caches its first answer."""
+        with patch.dict(os.environ, {}, clear=True):
+            client = SpotifyClient()
+            assert client.is_configured is False
+            os.environ.update(
+                {
+                    "SPOTIPY_CLIENT_ID": "test-id",
+                    "SPOTIPY_CLIENT_SECRET": "test-secret",
+                    "SPOTIPY_REDIRECT_URI": "http://localhost:8888/callback",
+                }
+            )
+            assert client.is_configured is False
+
 
 class TestSpotifyClientGetClient:
     """Tests for _get_client method."""
@@ -91,6 +115,18 @@ class TestSpotifyClientGetClient:
             with pytest.raises(SpotifyNotConfiguredError):
                 client._get_client()
 
+    def test_get_client_error_lists_missing_vars(self) -> None:
+        """Test _get_client error names only the unset variables."""
+        env = {"SPOTIPY_CLIENT_ID": "test-id", "SPOTIPY_CLIENT_SECRET": "secret"}
+        with patch.dict(os.environ, env, clear=True):
+            client = SpotifyClient()
+            with pytest.raises(SpotifyNotConfiguredError) as exc_info:
+                client._get_client()
+
+        message = str(exc_info.value)
+        assert "SPOTIPY_REDIRECT_URI" in message
+        assert "SPOTIPY_CLIENT_ID" not in message
+
     @patch("kutx2spotify.spotify.SpotifyOAuth")
     @patch("kutx2spotify.spotify.spotipy.Spotify")
     def test_get_client_creates_client(
@@ -136,6 +172,68 @@ class TestSpotifyClientGetClient:
             assert mock_spotify.call_count == 1
 
 
+class TestSpotifyClientPrepare:
+    """Tests for prepare method."""
+
+    def test_prepare_not_configured(self) -> None:
+        """Test prepare() does nothing without credentials."""
+        with patch.dict(os.environ, {}, clear=True):
+            client = SpotifyClient()
+            client.prepare()
+
+            assert client._client is None
+
+    @patch("kutx2spotify.spotify.SpotifyOAuth")
+    @patch("kutx2spotify.spotify.spotipy.Spotify")
+    def test_prepare_refreshes_cached_token(
+        self,
+        mock_spotify: MagicMock,
+        _mock_oauth: MagicMock,
+    ) -> None:
+        """Test prepare() builds the client and validates the cached token."""
+        env = {
+            "SPOTIPY_CLIENT_ID": "test-id",
+            "SPOTIPY_CLIENT_SECRET": "test-secret",
+            "SPOTIPY_REDIRECT_URI": "http://localhost:8888/callback",
+        }
+        auth_manager = mock_spotify.return_value.auth_manager
+        with patch.dict(os.environ, env, clear=True):
+            client = SpotifyClient()
+            client.prepare()
+
+            assert client._client is mock_spotify.return_value
+            auth_manager.validate_token.assert_called_once_with(
+                auth_manager.cache_handler.get_cached_token.return_value
+            )
+
+    @patch("kutx2spotify.spotify.SpotifyOAuth")
+    @patch("kutx2spotify.spotify.spotipy.Spotify")
+    def test_authorize_gets_access_token(
+        self,
+        mock_spotify: MagicMock,
+        _mock_oauth: MagicMock,
+    ) -> None:
+        """Test authorize() fetches a token, logging in if it must."""
+        env = {
+            "SPOTIPY_CLIENT_ID": "test-id",
+            "SPOTIPY_CLIENT_SECRET": "test-secret",
+            "SPOTIPY_REDIRECT_URI": "http://localhost:8888/callback",
+        }
+        auth_manager = mock_spotify.return_value.auth_manager
+        with patch.dict(os.environ, env, clear=True):
+            SpotifyClient().authorize()
+
+        auth_manager.get_access_token.assert_called_once_with(as_dict=False)
+
+    def test_authorize_not_configured(self) -> None:
+        """Test authorize() raises without credentials."""
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            pytest.raises(SpotifyNotConfiguredError),
+        ):
+            SpotifyClient().authorize()
+
+
 class TestSpotifyClientSearchTrack:
     """Tests for search_track method."""
 
@@ -487,6 +585,34 @@ class TestSpotifyClientCreatePlaylist:
             )
             assert result == "private-playlist"
 
+    @patch("kutx2spotify.spotify.SpotifyOAuth")
+    @patch("kutx2spotify.spotify.spotipy.Spotify")
+    def test_create_playlist_fetches_user_once(
+        self,
+        mock_spotify_class: MagicMock,
+        _mock_oauth: MagicMock,
+    ) -> None:
+        """Test create_playlist looks up the current user only once."""
+        mock_client = MagicMock()
+        mock_client.current_user.return_value = {"id": "user-123"}
+        mock_client.user_playlist_create.return_value = {"id": "playlist-id"}
+        mock_spotify_class.return_value = mock_client
+
+        env = {
+            "SPOTIPY_CLIENT_ID": "test-id",
+            "SPOTIPY_CLIENT_SECRET": "test-secret",
+            "SPOTIPY_REDIRECT_URI": "http://localhost:8888/callback",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            client = SpotifyClient()
+            client.create_playlist(name="KUTX 2026-01-01")
+            client.create_playlist(name="KUTX 2026-01-02")
+
+            mock_client.current_user.assert_called_once()
+            assert mock_client.user_playlist_create.call_count == 2
+            for call in mock_client.user_playlist_create.call_args_list:
+                assert call.kwargs["user"] == "user-123"
+
     def test_create_playlist_raises_when_not_configured(self) -> None:
         """Test create_playlist raises SpotifyNotConfiguredError."""
         with patch.dict(os.environ, {}, clear=True):
@@ -651,6 +777,26 @@ class TestSpotifyClientParseTrack:
         assert result.album == "Test Album"
         assert result.duration_ms == 180000
 
+    def test_parse_track_reuses_instance_for_same_id(self) -> None:
+        """Test _parse_track returns the cached track for a repeated id."""
+        client = SpotifyClient()
+        track_data = {
+            "id": "track-id",
+            "uri": "spotify:track:track-id",
+            "name": "Test Track",
+            "artists": [{"name": "Test Artist"}],
+            "album": {"name": "Test Album"},
+            "duration_ms": 180000,
+        }
+
+        first = client._parse_track(track_data)
+        second = client._parse_track(dict(track_data))
+        other = client._parse_track({**track_data, "id": "other-id"})
+
+        assert second is first
+        assert other is not first
+        assert other.id == "other-id"
+
     def test_parse_track_missing_duration(self) -> None:
         """Test _parse_track with missing duration."""
         client = SpotifyClient()